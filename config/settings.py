@@ -6,9 +6,24 @@ Handles loading and managing all configuration settings.
 import os
 import yaml
 import json
+import pickle
+import threading
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional, Callable
+
+# Prefer orjson for JSON parsing when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Use the libyaml C bindings when available, fall back to pure Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Part of every pickle sidecar key; bump when VoiceSettings or a parsed layout changes
+_CACHE_FORMAT = 2
 
 @dataclass
 class VoiceSettings:
@@ -19,6 +34,8 @@ class VoiceSettings:
     energy_threshold: int
     pause_threshold: float
     non_speaking_duration: float
+    local_asr: bool = False
+    local_asr_model: str = "base"
 
 @dataclass
 class APIKeys:
@@ -28,69 +45,153 @@ class APIKeys:
     gemini_api_key: str
 
 class ConfigManager:
-    """Configuration manager class."""
+    """Configuration manager class (process-wide singleton)."""
     
-    def __init__(self):
-        """Initialize configuration manager."""
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __new__(cls):
+        """Return the shared instance, creating it once under a lock."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
+        return cls._instance
+    
+    def _initialize(self):
+        """Initialize configuration manager.
+        
+        Configuration files and environment variables are read lazily on
+        first access of voice_settings, system_paths or api_keys.
+        """
         self.config_dir = Path(__file__).parent
         self.project_root = self.config_dir.parent
-        self.temp_directory = self.project_root / "temp"
+        self._loaded: Dict[str, Any] = {}
+        self._load_lock = threading.Lock()
+    
+    def _get_or_load(self, name: str, loader: Callable[[], Any]) -> Any:
+        """Return a loaded section, running its loader at most once per process."""
+        try:
+            return self._loaded[name]
+        except KeyError:
+            pass
         
-        # Create temp directory if it doesn't exist
-        self.temp_directory.mkdir(exist_ok=True)
+        with self._load_lock:
+            if name not in self._loaded:
+                self._loaded[name] = loader()
+            return self._loaded[name]
+    
+    @property
+    def temp_directory(self) -> Path:
+        """Temporary directory, created on first use."""
+        return self._get_or_load('temp_directory', self._create_temp_directory)
+    
+    @property
+    def voice_settings(self) -> VoiceSettings:
+        """Voice settings loaded from config.yaml."""
+        return self._get_or_load('voice_settings', self._load_config)
+    
+    @property
+    def system_paths(self) -> Dict[str, Any]:
+        """System paths loaded from system_paths.json."""
+        return self._get_or_load('system_paths', self._load_system_paths)
+    
+    @property
+    def api_keys(self) -> APIKeys:
+        """API keys loaded from environment variables."""
+        return self._get_or_load('api_keys', self._load_env_variables)
+    
+    def _create_temp_directory(self) -> Path:
+        """Create the temp directory if it doesn't exist."""
+        temp_directory = self.project_root / "temp"
+        temp_directory.mkdir(exist_ok=True)
+        return temp_directory
+    
+    def _load_cached(self, source: Path, parse: Callable[[Path], Any]) -> Any:
+        """Return parsed data for source, reusing a pickle sidecar while its format, mtime and size match."""
+        cache_file = source.with_name(source.name + ".cache.pkl")
+        st = source.stat()
+        key = (_CACHE_FORMAT, st.st_mtime_ns, st.st_size)
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == key:
+                return cached[1]
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass  # Missing, truncated or outdated cache, parse the source below
+        
+        data = parse(source)
         
-        # Load configurations
-        self._load_config()
-        self._load_system_paths()
-        self._load_env_variables()
+        # Write atomically so a concurrent reader never sees a partial cache
+        try:
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Cache is an optimization only
+        
+        return data
     
-    def _load_config(self):
+    def _load_config(self) -> VoiceSettings:
         """Load main configuration from YAML file."""
         config_file = self.config_dir / "config.yaml"
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            # Parse voice settings
-            voice_config = config.get('voice', {})
-            self.voice_settings = VoiceSettings(
-                language=voice_config.get('language', 'tr-TR'),
-                timeout=voice_config.get('timeout', 5),
-                ambient_duration=voice_config.get('ambient_duration', 1),
-                energy_threshold=voice_config.get('energy_threshold', 4000),
-                pause_threshold=voice_config.get('pause_threshold', 0.8),
-                non_speaking_duration=voice_config.get('non_speaking_duration', 0.5)
-            )
-            
+            return self._load_cached(config_file, self._parse_config)
         except Exception as e:
             raise RuntimeError(f"Error loading config.yaml: {e}")
     
-    def _load_system_paths(self):
+    @staticmethod
+    def _parse_config(config_file: Path) -> VoiceSettings:
+        """Parse config.yaml into voice settings."""
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+        
+        # Parse voice settings
+        voice_config = config.get('voice', {})
+        return VoiceSettings(
+            language=voice_config.get('language', 'tr-TR'),
+            timeout=voice_config.get('timeout', 5),
+            ambient_duration=voice_config.get('ambient_duration', 1),
+            energy_threshold=voice_config.get('energy_threshold', 4000),
+            pause_threshold=voice_config.get('pause_threshold', 0.8),
+            non_speaking_duration=voice_config.get('non_speaking_duration', 0.5),
+            local_asr=voice_config.get('local_asr', False),
+            local_asr_model=voice_config.get('local_asr_model', 'base')
+        )
+    
+    def _load_system_paths(self) -> Dict[str, Any]:
         """Load system paths from JSON file."""
         paths_file = self.config_dir / "system_paths.json"
         try:
-            with open(paths_file, 'r', encoding='utf-8') as f:
-                self.system_paths = json.load(f)
+            return self._load_cached(paths_file, self._parse_system_paths)
         except Exception as e:
             raise RuntimeError(f"Error loading system_paths.json: {e}")
     
-    def _load_env_variables(self):
+    @staticmethod
+    def _parse_system_paths(paths_file: Path) -> Dict[str, Any]:
+        """Parse system_paths.json."""
+        return _json_loads(paths_file.read_bytes())
+    
+    def _load_env_variables(self) -> APIKeys:
         """Load API keys from environment variables."""
-        self.api_keys = APIKeys(
-            weather_api_key=os.getenv('WEATHER_API_KEY', ''),
-            news_api_key=os.getenv('NEWS_API_KEY', ''),
-            gemini_api_key=os.getenv('GEMINI_API_KEY', '')
+        env = os.environ
+        api_keys = APIKeys(
+            weather_api_key=env.get('WEATHER_API_KEY', ''),
+            news_api_key=env.get('NEWS_API_KEY', ''),
+            gemini_api_key=env.get('GEMINI_API_KEY', '')
         )
         
         # Validate API keys
-        self._validate_api_keys()
+        self._validate_api_keys(api_keys)
+        return api_keys
     
-    def _validate_api_keys(self):
+    def _validate_api_keys(self, api_keys: APIKeys):
         """Validate that all required API keys are present."""
-        missing_keys = []
-        for key, value in self.api_keys.__dict__.items():
-            if not value:
-                missing_keys.append(key)
+        missing_keys = [f.name for f in fields(APIKeys) if not getattr(api_keys, f.name)]
         
         if missing_keys:
             raise RuntimeError(f"Missing required API keys: {', '.join(missing_keys)}")
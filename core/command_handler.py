@@ -2,33 +2,179 @@
 Command handler module for processing voice commands and executing corresponding actions.
 """
 
-import webbrowser
-import subprocess
 import os
-from typing import Optional, Dict, Callable, List
+import sys
+import threading
+from typing import Optional, Dict, Callable, List, Pattern, Tuple, FrozenSet, TYPE_CHECKING
 import logging
-import traceback
-from pathlib import Path
-from datetime import datetime
-import requests
-from dataclasses import dataclass
+import time
 import asyncio
-from .services.weather import WeatherService
-from .services.news import NewsService
-from .services.ai_service import AIService
-from .services.system_service import SystemService
 import re
-from concurrent.futures import ThreadPoolExecutor
+import functools
+from collections import OrderedDict
+
+if TYPE_CHECKING:
+    # Services are injected; import them only for type checking
+    from .services.weather import WeatherService
+    from .services.news import NewsService
+    from .services.ai_service import AIService
+    from .services.system_service import SystemService
+
+# Application opening keywords
+_APP_KEYWORDS = frozenset({"aç", "başlat", "çalıştır", "göster", "hazır"})
+
+# Common application names and their aliases
+_APP_ALIASES = {
+    # Browsers
+    "chrome": ["chrome", "google chrome", "tarayıcı", "browser"],
+    "firefox": ["firefox", "mozilla"],
+    "opera": ["opera", "opera gx", "opera browser"],
+    "edge": ["edge", "microsoft edge"],
+
+    # Office Apps
+    "word": ["word", "microsoft word", "kelime işlemci"],
+    "excel": ["excel", "microsoft excel", "hesap tablosu"],
+    "powerpoint": ["powerpoint", "microsoft powerpoint", "sunu", "sunum"],
+
+    # Development
+    "vscode": ["vscode", "visual studio code", "vs code", "visual studio"],
+
+    # Communication
+    "teams": ["teams", "microsoft teams"],
+    "discord": ["discord", "dc"],
+    "skype": ["skype"],
+    "telegram": ["telegram"],
+    "whatsapp": ["whatsapp", "wp"],
+
+    # Media & Entertainment
+    "spotify": ["spotify", "müzik"],
+    "steam": ["steam", "valve"],
+    "epic": ["epic", "epic games"],
+    "vlc": ["vlc", "vlc player", "media player"],
+
+    # System Apps
+    "notepad": ["notepad", "not defteri", "not", "notlar"],
+    "calculator": ["calculator", "hesap makinesi", "hesap", "hesapla", "hesaplayıcı"],
+    "paint": ["paint", "resim", "çizim"],
+    "cmd": ["cmd", "komut istemi", "terminal", "command prompt"],
+    "explorer": ["explorer", "dosya gezgini", "gezgin", "dosyalar"],
+    "taskmgr": ["task manager", "görev yöneticisi", "görevler"],
+    "control": ["control panel", "denetim masası", "kontrol", "ayarlar"]
+}
+
+# Özel uygulama açılış yanıtları
+_APP_RESPONSES = {
+    "discord": "Discord'u senin için açıyorum. İyi eğlenceler!",
+    "steam": "Steam'i başlatıyorum. İyi oyunlar!",
+    "opera": "Opera tarayıcını açıyorum. Keyifli tarama!",
+    "spotify": "Spotify açılıyor. Keyifli dinlemeler!",
+    "chrome": "Chrome tarayıcını açıyorum. İyi gezinmeler!",
+    "firefox": "Firefox tarayıcını açıyorum. İyi gezinmeler!",
+    "vscode": "Visual Studio Code başlatılıyor. İyi kodlamalar!",
+    "notepad": "Not defteri açılıyor. İyi notlar!",
+    "calculator": "Hesap makinesi açılıyor. İyi hesaplamalar!"
+}
+
+# Fixed phrases spoken often enough to be worth synthesizing ahead of time
+COMMON_RESPONSES = (
+    "Üzgünüm, bir hata oluştu. Lütfen tekrar deneyin.",
+    "Üzgünüm, açmak istediğiniz uygulamayı anlayamadım.",
+    "Google açılıyor",
+    "YouTube açılıyor",
+    "Hesap makinesi açılıyor",
+    *_APP_RESPONSES.values(),
+)
+
+# News category words mapped to NewsAPI categories
+_NEWS_CATEGORIES = {sys.intern(word): category for word, category in {
+    "iş": "business",
+    "eğlence": "entertainment",
+    "sağlık": "health",
+    "bilim": "science",
+    "spor": "sports",
+    "teknoloji": "technology"
+}.items()}
+
+_NEWS_CATEGORY_WORDS = frozenset(_NEWS_CATEGORIES)
+
+# Prompt used to ask the AI which application a command refers to
+_OPEN_APP_PROMPT = """
+Aşağıdaki komuttan açılması istenen uygulamanın adını belirle:
+Komut: "{command}"
+
+Lütfen sadece uygulama adını döndür, başka bir şey yazma.
+Örnek yanıt formatları: 
+- "chrome"
+- "notepad"
+- "calculator"
+- "spotify"
+
+Eğer uygulama adı belirlenemezse sadece "unknown" döndür.
+"""
+
+# Maximum number of AI-resolved application names to remember
+_AI_APP_CACHE_SIZE = 128
+
+# Read-only commands whose responses can be reused for a short while
+_CACHEABLE_COMMANDS = frozenset({"hava durumu", "haberler", "haber ara"})
+_RESPONSE_CACHE_TTL = 30.0  # seconds
+_RESPONSE_CACHE_SIZE = 64
+
+# Web shortcut keywords, in priority order
+_WEB_KEYWORDS = ("youtube", "google")
+
+# Application alias -> canonical application name
+_APP_ALIAS_TO_NAME = {alias: app_name for app_name, aliases in _APP_ALIASES.items() for alias in aliases}
+
+# Keyword tiers recognized by the router, in routing priority order
+_TIER_APP = "app"
+_TIER_WEB = "web"
+_TIER_CMD = "cmd"
+_TIER_ALIAS = "alias"
+
+def _keyword_alternation(keywords) -> str:
+    """Regex alternation of keywords, longest first so the longest match at a position wins"""
+    return "|".join(re.escape(keyword) for keyword in sorted(set(keywords), key=len, reverse=True))
+
+def _build_router(tiers: Dict[str, List[str]]) -> Optional[Pattern]:
+    """Compile keyword tiers into one pattern scanned in a single pass.
+    
+    The leading lookahead over every keyword skips positions where nothing
+    starts. At the remaining positions, one optional lookahead per tier
+    captures that tier's longest keyword, so overlapping hits from different
+    tiers are all reported. Word boundaries are intentionally not used, since
+    Turkish suffixes attach to the keyword (e.g. "tarayıcıyı").
+    """
+    tiers = {tier: keywords for tier, keywords in tiers.items() if keywords}
+    if not tiers:
+        return None
+    
+    union = _keyword_alternation(keyword for keywords in tiers.values() for keyword in keywords)
+    lookaheads = "".join(
+        f"(?:(?=(?P<{tier}>{_keyword_alternation(keywords)})))?"
+        for tier, keywords in tiers.items()
+    )
+    return re.compile(f"(?={union}){lookaheads}")
 
-@dataclass
 class CommandContext:
     """Context object for command execution"""
-    command: str
-    params: dict = None
+    __slots__ = ("command", "params", "lower_command", "tokens", "token_set", "cacheable")
+    
+    def __init__(self, command: str, params: dict = None, lower_command: str = None,
+                 tokens: Tuple[str, ...] = None, token_set: FrozenSet[str] = None):
+        self.command = command
+        self.params = params
+        self.lower_command = command.lower() if lower_command is None else lower_command
+        self.tokens = tuple(self.lower_command.split()) if tokens is None else tokens
+        self.token_set = frozenset(self.tokens) if token_set is None else token_set
+        self.cacheable = False  # Set by a handler whose response holds real data, not an error reply
+    
+    def __repr__(self):
+        return f"CommandContext(command={self.command!r}, params={self.params!r})"
     
 class CommandHandler:
-    def __init__(self, weather_service: WeatherService, news_service: NewsService, 
-                 ai_service: AIService, system_service: SystemService):
+    def __init__(self, weather_service: "WeatherService", news_service: "NewsService", 
+                 ai_service: "AIService", system_service: "SystemService"):
         """Initialize CommandHandler"""
         self.logger = logging.getLogger(__name__)
         self._commands = {}
@@ -40,14 +186,31 @@ class CommandHandler:
         self.ai_service = ai_service
         self.system_service = system_service
         
-        # Initialize thread pool
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Command -> application name answers from the AI
+        self._ai_app_cache: "OrderedDict[str, str]" = OrderedDict()
+        
+        # Last formatted time response and the second it was made for
+        self._time_cache: Tuple[int, str] = (-1, "")
+        
+        # Command -> (expiry, response) for read-only commands
+        self._response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        
+        # True when the last processed command launched an application
+        self.apps_changed = False
         
         # Register default commands first
         self._register_default_commands()
         
         # Then register command aliases
         self._register_command_aliases()
+        
+        # Compile keyword matchers
+        self._rebuild_matchers()
+        
+        # Resolve the default browser off the hot path where os.startfile is unavailable
+        self._browser = None
+        if not hasattr(os, "startfile"):
+            threading.Thread(target=self._warm_browser, daemon=True).start()
     
     def _register_default_commands(self):
         """Register default command handlers"""
@@ -110,146 +273,137 @@ class CommandHandler:
             "açar mısın": "uygulama_ac"
         })
     
+    def _rebuild_matchers(self):
+        """Compile app, web, command and alias keywords into the single-pass router"""
+        # Intern keywords and canonical names so dict probes compare by identity
+        self._commands = {sys.intern(keyword): handler for keyword, handler in self._commands.items()}
+        self._command_aliases = {
+            sys.intern(alias): sys.intern(command) for alias, command in self._command_aliases.items()
+        }
+        
+        self._router = _build_router({
+            _TIER_APP: list(_APP_ALIAS_TO_NAME),
+            _TIER_WEB: list(_WEB_KEYWORDS),
+            _TIER_CMD: list(self._commands),
+            _TIER_ALIAS: list(self._command_aliases),
+        })
+        
+        # Routes for registered phrases, precomputed with the same scan so an
+        # utterance that is exactly a keyword resolves with one dict probe
+        self._exact_routes = {
+            phrase: self._route(phrase)
+            for phrase in (*self._commands, *self._command_aliases, *_APP_ALIAS_TO_NAME, *_WEB_KEYWORDS)
+        }
+        
+        # Fresh memo table so stale routes never survive a registration
+        self._route_cached = functools.lru_cache(maxsize=512)(self._route)
+    
     def register_command(self, keyword: str, handler: Callable):
         """Register a new command handler"""
         try:
-            self._commands[keyword.lower()] = handler
+            self._commands[keyword.lower().strip()] = handler
+            self._rebuild_matchers()
         except Exception as e:
             self.logger.error(f"Error registering command '{keyword}': {e}")
             raise
-        
-    def _find_matching_command(self, text: str) -> Optional[str]:
-        """Find the best matching command for the given text"""
-        text = text.lower()
-        
-        # First check direct commands
-        for keyword in self._commands.keys():
-            if keyword in text:
-                return keyword
-        
-        # Then check aliases
-        for alias, command in self._command_aliases.items():
-            if alias in text:
-                return command
-                
+    
+    def _route(self, text: str) -> Dict[str, Tuple[str, ...]]:
+        """Scan normalized (lowercased, stripped) text once, returning keyword hits per tier"""
+        hits: Dict[str, List[str]] = {}
+        if self._router:
+            for match in self._router.finditer(text):
+                for tier, keyword in match.groupdict().items():
+                    if keyword:
+                        hits.setdefault(tier, []).append(keyword)
+        return {tier: tuple(keywords) for tier, keywords in hits.items()}
+    
+    def _lookup_route(self, text: str) -> Dict[str, Tuple[str, ...]]:
+        """Route normalized text, probing exact phrases before scanning"""
+        hits = self._exact_routes.get(text)
+        if hits is None:
+            hits = self._route_cached(text)
+        return hits
+    
+    def _command_from_hits(self, hits: Dict[str, Tuple[str, ...]]) -> Optional[str]:
+        """Pick the longest command keyword, falling back to the longest alias"""
+        if _TIER_CMD in hits:
+            return max(hits[_TIER_CMD], key=len)
+        if _TIER_ALIAS in hits:
+            return self._command_aliases[max(hits[_TIER_ALIAS], key=len)]
         return None
         
-    def _get_app_name_from_command(self, command: str) -> Optional[str]:
+    def _get_app_name_from_command(self, command: str, hits: Optional[Dict[str, Tuple[str, ...]]] = None,
+                                   token_set: Optional[FrozenSet[str]] = None) -> Optional[str]:
         """Extract application name from command"""
-        # Application opening keywords
-        app_keywords = {"aç", "başlat", "çalıştır", "göster", "hazır"}
-        
-        # Common application names and their aliases
-        APP_ALIASES = {
-            # Browsers
-            "chrome": ["chrome", "google chrome", "tarayıcı", "browser"],
-            "firefox": ["firefox", "mozilla"],
-            "opera": ["opera", "opera gx", "opera browser"],
-            "edge": ["edge", "microsoft edge"],
-            
-            # Office Apps
-            "word": ["word", "microsoft word", "kelime işlemci"],
-            "excel": ["excel", "microsoft excel", "hesap tablosu"],
-            "powerpoint": ["powerpoint", "microsoft powerpoint", "sunu", "sunum"],
-            
-            # Development
-            "vscode": ["vscode", "visual studio code", "vs code", "visual studio"],
-            
-            # Communication
-            "teams": ["teams", "microsoft teams"],
-            "discord": ["discord", "dc"],
-            "skype": ["skype"],
-            "telegram": ["telegram"],
-            "whatsapp": ["whatsapp", "wp"],
-            
-            # Media & Entertainment
-            "spotify": ["spotify", "müzik"],
-            "steam": ["steam", "valve"],
-            "epic": ["epic", "epic games"],
-            "vlc": ["vlc", "vlc player", "media player"],
-            
-            # System Apps
-            "notepad": ["notepad", "not defteri", "not", "notlar"],
-            "calculator": ["calculator", "hesap makinesi", "hesap", "hesapla", "hesaplayıcı"],
-            "paint": ["paint", "resim", "çizim"],
-            "cmd": ["cmd", "komut istemi", "terminal", "command prompt"],
-            "explorer": ["explorer", "dosya gezgini", "gezgin", "dosyalar"],
-            "taskmgr": ["task manager", "görev yöneticisi", "görevler"],
-            "control": ["control panel", "denetim masası", "kontrol", "ayarlar"]
-        }
-
-        # Split command into words
-        words = command.lower().split()
+        command = command.lower().strip()
+        if token_set is None:
+            token_set = frozenset(command.split())
         
         # Check if command contains an opening keyword
-        if not any(keyword in words for keyword in app_keywords):
-            return None
-            
-        # Get the part after the keyword
-        for i, word in enumerate(words):
-            if word in app_keywords:
-                app_phrase = " ".join(words[:i] + words[i+1:])  # Tüm kelimeleri al, anahtar kelime hariç
-                break
-        else:
+        if _APP_KEYWORDS.isdisjoint(token_set):
             return None
-            
+        
         # Check for direct matches in aliases
-        for app_name, aliases in APP_ALIASES.items():
-            if any(alias in app_phrase for alias in aliases) or any(alias in command for alias in aliases):
-                return app_name
-                
-        # If no match found in aliases, try AI-based matching
+        if hits is None:
+            hits = self._lookup_route(command)
+        if _TIER_APP in hits:
+            return _APP_ALIAS_TO_NAME[max(hits[_TIER_APP], key=len)]
         return None
 
     async def process_command(self, command: str) -> str:
         """Process a voice command and return the response"""
+        self.apps_changed = False
         try:
-            command = command.lower().strip()
+            # Collapse whitespace so spacing variants share cache entries
+            command = " ".join(command.lower().split())
+            context = CommandContext(command=command, lower_command=command)
+            
+            # Route the command once; every check below reads these hits
+            hits = self._lookup_route(command)
             
             # First check for application opening commands
-            app_name = self._get_app_name_from_command(command)
+            app_name = self._get_app_name_from_command(command, hits, context.token_set)
             if app_name:
                 # Eğer hesap makinesi ise ve "hazır" kelimesi varsa özel yanıt ver
                 if app_name == "calculator" and "hazır" in command:
                     return "Hesap makinesi hazır! Ne hesaplamak istersin?"
                     
                 # Uygulamayı başlat
-                success = self.system_service.launch_application(app_name)
-                
-                # Özel yanıtlar
-                app_responses = {
-                    "discord": "Discord'u senin için açıyorum. İyi eğlenceler!",
-                    "steam": "Steam'i başlatıyorum. İyi oyunlar!",
-                    "opera": "Opera tarayıcını açıyorum. Keyifli tarama!",
-                    "spotify": "Spotify açılıyor. Keyifli dinlemeler!",
-                    "chrome": "Chrome tarayıcını açıyorum. İyi gezinmeler!",
-                    "firefox": "Firefox tarayıcını açıyorum. İyi gezinmeler!",
-                    "vscode": "Visual Studio Code başlatılıyor. İyi kodlamalar!",
-                    "notepad": "Not defteri açılıyor. İyi notlar!",
-                    "calculator": "Hesap makinesi açılıyor. İyi hesaplamalar!"
-                }
+                success = await self._launch_application(app_name)
                 
                 if success:
-                    return app_responses.get(app_name, f"{app_name.title()} başarıyla açıldı.")
+                    return _APP_RESPONSES.get(app_name, f"{app_name.title()} başarıyla açıldı.")
                 else:
                     return f"Üzgünüm, {app_name.title()} uygulaması bilgisayarınızda bulunamadı veya açılamadı."
             
             # Check for web commands
-            if "youtube" in command:
-                return self._open_youtube(CommandContext(command=command))
-            elif "google" in command:
-                return self._open_google(CommandContext(command=command))
+            web_hits = hits.get(_TIER_WEB, ())
+            if "youtube" in web_hits:
+                return await self._execute_command(self._open_youtube, context)
+            elif "google" in web_hits:
+                return await self._execute_command(self._open_google, context)
             
             # Check for other commands
-            command_key = self._find_matching_command(command)
+            command_key = self._command_from_hits(hits)
             if command_key and command_key in self._commands:
-                return await self._execute_command(
-                    self._commands[command_key],
-                    CommandContext(command=command)
-                )
+                if command_key not in _CACHEABLE_COMMANDS:
+                    return await self._execute_command(self._commands[command_key], context)
+                
+                cached = self._response_cache.get(command)
+                if cached and cached[0] > time.monotonic():
+                    return cached[1]
+                
+                response = await self._execute_command(self._commands[command_key], context)
+                # Error replies are not cached so a transient outage is retried on the next request
+                if context.cacheable:
+                    self._response_cache[command] = (time.monotonic() + _RESPONSE_CACHE_TTL, response)
+                    self._response_cache.move_to_end(command)
+                    if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+                return response
             
             # If no command matches, use AI
-            return await self._chat_with_ai(CommandContext(command=command))
+            return await self._chat_with_ai(context)
             
         except Exception as e:
             self.logger.error(f"Error processing command: {e}")
@@ -262,15 +416,42 @@ class CommandHandler:
                 return await handler(context)
             else:
                 # Sync fonksiyonları async olarak çalıştır
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 return await loop.run_in_executor(None, handler, context)
         except Exception as e:
-            self.logger.error(f"Command execution error: {e}\n{traceback.format_exc()}")
+            self.logger.error(f"Command execution error: {e}", exc_info=True)
             return f"Komut çalıştırılırken bir hata oluştu: {str(e)}"
     
+    async def _launch_application(self, app_name: str) -> bool:
+        """Launch an application without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        success = await loop.run_in_executor(None, self.system_service.launch_application, app_name)
+        if success:
+            self.apps_changed = True
+        return success
+    
+    def _warm_browser(self):
+        """Run webbrowser's platform probe once and keep the resulting controller"""
+        try:
+            import webbrowser
+            self._browser = webbrowser.get()
+        except Exception as e:
+            self.logger.warning(f"Could not resolve default browser: {e}")
+    
+    def _open_url(self, url: str):
+        """Open url in the default browser"""
+        if hasattr(os, "startfile"):
+            # Windows: hand the URL to the shell, no webbrowser probing
+            os.startfile(url)
+        elif self._browser is not None:
+            self._browser.open(url)
+        else:
+            import webbrowser
+            webbrowser.open(url)
+    
     def _open_google(self, context: CommandContext) -> str:
         try:
-            webbrowser.open("https://www.google.com")
+            self._open_url("https://www.google.com")
             return "Google açılıyor"
         except Exception as e:
             self.logger.error(f"Error opening Google: {e}")
@@ -278,7 +459,7 @@ class CommandHandler:
     
     def _open_youtube(self, context: CommandContext) -> str:
         try:
-            webbrowser.open("https://www.youtube.com")
+            self._open_url("https://www.youtube.com")
             return "YouTube açılıyor"
         except Exception as e:
             self.logger.error(f"Error opening YouTube: {e}")
@@ -287,7 +468,7 @@ class CommandHandler:
     def _get_weather(self, context: CommandContext) -> str:
         try:
             # Extract city name from command
-            words = context.command.lower().split()
+            words = context.tokens
             try:
                 city_index = words.index("durumu") + 1
                 city = words[city_index]
@@ -296,6 +477,7 @@ class CommandHandler:
                 
             weather_info = self.weather_service.get_weather(city)
             if weather_info:
+                context.cacheable = True
                 return self.weather_service.format_weather_response(weather_info)
             return "Hava durumu bilgisi alınamadı"
         except Exception as e:
@@ -304,23 +486,37 @@ class CommandHandler:
     
     def _get_time(self, context: CommandContext) -> str:
         try:
-            now = datetime.now()
-            return f"Şu anki saat: {now.strftime('%H:%M:%S')}"
+            second = int(time.time())
+            cached_second, response = self._time_cache
+            if second != cached_second:
+                now = time.localtime(second)
+                response = f"Şu anki saat: {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+                self._time_cache = (second, response)
+            return response
         except Exception as e:
             self.logger.error(f"Error getting time: {e}")
             return "Saat bilgisi alınırken bir hata oluştu"
     
-    def _shutdown_computer(self, context: CommandContext) -> str:
+    async def _spawn_detached(self, *args: str):
+        """Start a process on the event loop without waiting for it to exit"""
+        import subprocess
+        await asyncio.create_subprocess_exec(
+            *args,
+            close_fds=True,
+            creationflags=getattr(subprocess, "DETACHED_PROCESS", 0)
+        )
+    
+    async def _shutdown_computer(self, context: CommandContext) -> str:
         try:
-            subprocess.run(["shutdown", "/s", "/t", "1"])
+            await self._spawn_detached("shutdown", "/s", "/t", "1")
             return "Bilgisayar kapatılıyor"
         except Exception as e:
             self.logger.error(f"Error shutting down: {e}")
             return "Bilgisayar kapatılırken bir hata oluştu"
     
-    def _restart_computer(self, context: CommandContext) -> str:
+    async def _restart_computer(self, context: CommandContext) -> str:
         try:
-            subprocess.run(["shutdown", "/r", "/t", "1"])
+            await self._spawn_detached("shutdown", "/r", "/t", "1")
             return "Bilgisayar yeniden başlatılıyor"
         except Exception as e:
             self.logger.error(f"Error restarting: {e}")
@@ -328,7 +524,8 @@ class CommandHandler:
     
     def _open_calculator(self, context: CommandContext) -> str:
         try:
-            subprocess.Popen(['calc.exe'])
+            os.startfile('calc.exe')
+            self.apps_changed = True
             return "Hesap makinesi açılıyor"
         except Exception as e:
             self.logger.error(f"Error opening calculator: {e}")
@@ -337,23 +534,13 @@ class CommandHandler:
     def _get_news(self, context: CommandContext) -> str:
         try:
             # Extract category if specified
-            words = context.command.lower().split()
             category = None
-            categories = {
-                "iş": "business",
-                "eğlence": "entertainment",
-                "sağlık": "health",
-                "bilim": "science",
-                "spor": "sports",
-                "teknoloji": "technology"
-            }
-            
-            for word in words:
-                if word in categories:
-                    category = categories[word]
-                    break
+            if not _NEWS_CATEGORY_WORDS.isdisjoint(context.token_set):
+                # Keep the first category word in spoken order
+                category = next(_NEWS_CATEGORIES[word] for word in context.tokens if word in _NEWS_CATEGORIES)
                     
             articles = self.news_service.get_top_headlines(category=category)
+            context.cacheable = bool(articles)
             return self.news_service.format_articles_response(articles)
         except Exception as e:
             self.logger.error(f"Error getting news: {e}")
@@ -362,11 +549,12 @@ class CommandHandler:
     def _search_news(self, context: CommandContext) -> str:
         try:
             # Extract search query
-            query = context.command.lower().replace("haber ara", "").strip()
+            query = context.lower_command.replace("haber ara", "").strip()
             if not query:
                 return "Arama yapmak için bir konu belirtmelisiniz"
                 
             articles = self.news_service.search_news(query)
+            context.cacheable = bool(articles)
             return self.news_service.format_articles_response(articles, detailed=True)
         except Exception as e:
             self.logger.error(f"Error searching news: {e}")
@@ -375,40 +563,44 @@ class CommandHandler:
     async def _chat_with_ai(self, context: CommandContext) -> str:
         """Handle conversation with AI"""
         try:
-            response = await self.ai_service.get_response(context.command)
+            parts = []
+            async for chunk in self.ai_service.stream_response(context.command):
+                parts.append(chunk)
+            response = "".join(parts)
             return response if response else "Üzgünüm, şu anda cevap veremiyorum"
         except Exception as e:
             self.logger.error(f"Error in AI chat: {e}")
             return "AI ile iletişim kurulurken bir hata oluştu"
     
+    async def _resolve_app_name_with_ai(self, command: str) -> Optional[str]:
+        """Ask the AI for the application name in command, reusing remembered answers"""
+        if command in self._ai_app_cache:
+            self._ai_app_cache.move_to_end(command)
+            return self._ai_app_cache[command]
+        
+        # AI'dan uygulama adını analiz etmesini iste
+        app_name = await self.ai_service.get_response(_OPEN_APP_PROMPT.format(command=command))
+        self.logger.info(f"AI returned app name: {app_name}")
+        
+        if not app_name or app_name.lower() == "unknown":
+            return None
+        
+        return app_name.strip().lower()
+    
     async def _open_application_with_ai(self, context: CommandContext) -> str:
         """AI yardımıyla uygulamayı açar"""
         try:
-            # AI'dan uygulama adını analiz etmesini iste
-            ai_prompt = f"""
-            Aşağıdaki komuttan açılması istenen uygulamanın adını belirle:
-            Komut: "{context.command}"
-            
-            Lütfen sadece uygulama adını döndür, başka bir şey yazma.
-            Örnek yanıt formatları: 
-            - "chrome"
-            - "notepad"
-            - "calculator"
-            - "spotify"
-            
-            Eğer uygulama adı belirlenemezse sadece "unknown" döndür.
-            """
-            
-            app_name = await self.ai_service.get_response(ai_prompt)
-            self.logger.info(f"AI returned app name: {app_name}")
-            
-            if not app_name or app_name.lower() == "unknown":
+            command = context.lower_command.strip()
+            app_name = await self._resolve_app_name_with_ai(command)
+            if not app_name:
                 return "Üzgünüm, açmak istediğiniz uygulamayı anlayamadım."
             
-            app_name = app_name.strip().lower()
-            
             # Uygulamayı başlat
-            if self.system_service.launch_application(app_name):
+            if await self._launch_application(app_name):
+                # Only remember answers that led to a successful launch
+                self._ai_app_cache[command] = app_name
+                if len(self._ai_app_cache) > _AI_APP_CACHE_SIZE:
+                    self._ai_app_cache.popitem(last=False)
                 return f"{app_name.title()} uygulaması başarıyla açıldı."
             else:
                 return f"Üzgünüm, {app_name.title()} uygulaması bilgisayarınızda bulunamadı veya açılamadı."
@@ -1,5 +1,4 @@
 import logging
-import traceback
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 
@@ -72,7 +71,7 @@ class VoiceAssistantUI:
             self.logger.info("Voice Assistant UI initialized successfully")
             
         except Exception as e:
-            self.logger.critical(f"Failed to initialize UI: {e}\n{traceback.format_exc()}")
+            self.logger.critical(f"Failed to initialize UI: {e}", exc_info=True)
             raise
 
     def stop_speaking(self):
@@ -82,5 +81,5 @@ class VoiceAssistantUI:
             self.system_service.stop_speaking()
             self.log_message("Konuşma durduruldu.")
         except Exception as e:
-            self.logger.error(f"Error stopping speech: {e}\n{traceback.format_exc()}")
+            self.logger.error(f"Error stopping speech: {e}", exc_info=True)
             self.log_message("Konuşma durdurulamadı: " + str(e)) 
\ No newline at end of file
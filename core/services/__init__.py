@@ -1,16 +1,37 @@
 """
 Service modules initialization.
 This package contains various service integrations for the Lazzaran voice assistant.
+
+Services are imported lazily on first attribute access, so importing one
+service module does not pull in the dependencies of the others.
 """
 
-from .ai_service import AIService
-from .news import NewsService
-from .system_service import SystemService
-from .weather import WeatherService
+import importlib
+import sys
+
+# slots=True requires Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+_SERVICE_MODULES = {
+    'AIService': '.ai_service',
+    'NewsService': '.news',
+    'SystemService': '.system_service',
+    'WeatherService': '.weather'
+}
 
 __all__ = [
     'AIService',
     'NewsService',
     'SystemService',
     'WeatherService'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        value = getattr(importlib.import_module(_SERVICE_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
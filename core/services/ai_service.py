@@ -3,20 +3,29 @@ AI service for handling conversations using Google's Gemini AI.
 """
 
 import google.generativeai as genai
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, AsyncIterator
 import logging
+import json
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 
+# Prefer orjson for serializing conversations when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 @dataclass
 class Conversation:
-    messages: List[Dict[str, str]]
+    messages: List[Dict[str, Any]]
     start_time: datetime
     last_update: datetime
 
 class AIService:
     def __init__(self, api_key: str):
         self.logger = logging.getLogger(__name__)
+        self._warmed = False
         self.setup_ai(api_key)
         self.conversation = None
         self.reset_conversation()
@@ -28,11 +37,25 @@ class AIService:
             self.model = genai.GenerativeModel('gemini-pro')
             # Set up initial context for Turkish responses
             initial_prompt = "Sen Türkçe konuşan bir sesli asistansın. Tüm yanıtlarını Türkçe olarak ver ve doğal, arkadaşça bir ton kullan."
-            self.chat = self.model.start_chat(history=[{"role": "user", "parts": [initial_prompt]}])
+            # Chat history sent with every async request
+            self.history: List[Dict[str, Any]] = [{"role": "user", "parts": [initial_prompt]}]
+            
+            # Open the connection in the background so the first question doesn't pay for it
+            if not self._warmed:
+                self._warmed = True
+                threading.Thread(target=self._warm_up, args=(initial_prompt,), daemon=True).start()
         except Exception as e:
             self.logger.error(f"Error setting up Gemini AI: {e}")
             raise
     
+    def _warm_up(self, prompt: str):
+        """Prime the Gemini connection with a cheap request that doesn't touch chat history"""
+        try:
+            self.model.count_tokens(prompt)
+            self.logger.debug("Gemini connection warmed up")
+        except Exception as e:
+            self.logger.warning(f"Gemini warm-up failed: {e}")
+    
     def reset_conversation(self):
         """Reset the conversation history"""
         self.conversation = Conversation(
@@ -41,31 +64,47 @@ class AIService:
             last_update=datetime.now()
         )
     
+    async def stream_response(self, text: str) -> AsyncIterator[str]:
+        """
+        Stream the AI response for the given text input chunk by chunk.
+        Uses the SDK's async client so the event loop stays free during the request.
+        """
+        # Add user message to history
+        self.conversation.messages.append({
+            "role": "user",
+            "content": text,
+            "timestamp": datetime.now()  # Formatted lazily in save_conversation
+        })
+        
+        # Get AI response
+        user_content = {"role": "user", "parts": [text]}
+        response = await self.model.generate_content_async(self.history + [user_content], stream=True)
+        
+        parts = []
+        async for chunk in response:
+            parts.append(chunk.text)
+            yield chunk.text
+        
+        response_text = "".join(parts)
+        self.history.append(user_content)
+        self.history.append({"role": "model", "parts": [response_text]})
+        
+        # Add AI response to history
+        now = datetime.now()
+        self.conversation.messages.append({
+            "role": "assistant",
+            "content": response_text,
+            "timestamp": now
+        })
+        
+        self.conversation.last_update = now
+    
     async def get_response(self, text: str) -> Optional[str]:
         """
         Get AI response for the given text input.
         """
         try:
-            # Add user message to history
-            self.conversation.messages.append({
-                "role": "user",
-                "content": text,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            # Get AI response
-            response = self.chat.send_message(text)
-            
-            # Add AI response to history
-            response_text = response.text
-            self.conversation.messages.append({
-                "role": "assistant",
-                "content": response_text,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            self.conversation.last_update = datetime.now()
-            return response_text
+            return "".join([chunk async for chunk in self.stream_response(text)])
             
         except Exception as e:
             self.logger.error(f"Error getting AI response: {e}")
@@ -88,18 +127,30 @@ class AIService:
             f"Son güncelleme: {self.conversation.last_update.strftime('%H:%M:%S')}"
         )
     
+    @staticmethod
+    def _json_default(value):
+        """Serialize message timestamps stored as datetime objects."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    
     def save_conversation(self, filepath: str):
         """
         Save the current conversation to a file.
         """
         try:
-            import json
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'messages': self.conversation.messages,
-                    'start_time': self.conversation.start_time.isoformat(),
-                    'last_update': self.conversation.last_update.isoformat()
-                }, f, ensure_ascii=False, indent=2)
+            data = {
+                'messages': self.conversation.messages,
+                'start_time': self.conversation.start_time.isoformat(),
+                'last_update': self.conversation.last_update.isoformat()
+            }
+            if orjson is not None:
+                # orjson writes UTF-8 bytes and serializes datetime natively
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, default=self._json_default, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2, default=self._json_default)
             return True
         except Exception as e:
             self.logger.error(f"Error saving conversation: {e}")
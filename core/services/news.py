@@ -3,13 +3,71 @@ News service for fetching and formatting news articles.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Any, Tuple, Hashable, Dict
+import json
 import logging
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 
-@dataclass
+from . import _DATACLASS_SLOTS
+
+# Prefer orjson for decoding API responses when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Prefer selectolax's Lexbor parser for article pages when installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+_CONTENT_TAGS = ('article', 'main', 'div')
+_CONTENT_CLASSES = ('content', 'article-content', 'post-content')
+_CONTENT_SELECTOR = ", ".join(f"{tag}.{cls}" for tag in _CONTENT_TAGS for cls in _CONTENT_CLASSES)
+
+# Limit BeautifulSoup tree construction to the parts get_article_summary reads
+_CONTENT_STRAINER = SoupStrainer(list(_CONTENT_TAGS), class_=list(_CONTENT_CLASSES))
+_PARAGRAPH_STRAINER = SoupStrainer('p')
+
+# Category display names used in formatted responses
+_CATEGORY_NAMES = {
+    'business': 'İş',
+    'entertainment': 'Eğlence',
+    'health': 'Sağlık',
+    'science': 'Bilim',
+    'sports': 'Spor',
+    'technology': 'Teknoloji',
+    'general': 'Genel',
+    'search': 'Arama Sonuçları'
+}
+
+# Response cache lifetimes (seconds); expired entries are kept as a stale fallback
+_HEADLINES_TTL = 60.0
+_SEARCH_TTL = 60.0
+_SUMMARY_TTL = 30 * 24 * 3600.0
+_CACHE_SIZE = 512
+
+# (connect, read) timeouts for all outgoing requests
+_REQUEST_TIMEOUT = (3, 10)
+
+# Connection pool sizing; fetch workers never outnumber pooled keep-alive connections
+_POOL_HOSTS = 16
+_POOL_MAXSIZE = 32
+_MAX_FETCH_WORKERS = 8
+
+@dataclass(**_DATACLASS_SLOTS)
 class NewsArticle:
     title: str
     description: str
@@ -24,11 +82,52 @@ class NewsService:
         self.language = language
         self.logger = logging.getLogger(__name__)
         self.base_url = "https://newsapi.org/v2"
+        self._cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Keep-alive session so repeated calls reuse the TCP/TLS connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_HOSTS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Long-lived workers for concurrent fetches, sharing the session's pool
+        self._executor = ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS, thread_name_prefix="news")
+    
+    def close(self):
+        """Close pooled HTTP connections and fetch workers."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+    
+    def _cache_lookup(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Return (expires_at, value) for key, fresh or stale, or None."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+    
+    def _cache_store(self, key: Hashable, value: Any, ttl: float):
+        """Store value under key for ttl seconds, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
         
     def get_top_headlines(self, category: str = None, max_results: int = 5) -> List[NewsArticle]:
         """
         Fetch top headlines, optionally filtered by category.
         """
+        cache_key = ('headlines', category, self.language, max_results)
+        cached = self._cache_lookup(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
             endpoint = f"{self.base_url}/top-headlines"
             params = {
@@ -40,34 +139,45 @@ class NewsService:
             if category:
                 params['category'] = category
                 
-            response = requests.get(endpoint, params=params)
+            response = self.session.get(endpoint, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            articles = []
-            for article in response.json()['articles'][:max_results]:
-                try:
-                    articles.append(NewsArticle(
-                        title=article['title'],
-                        description=article.get('description', ''),
-                        url=article['url'],
-                        source=article['source']['name'],
-                        published_at=datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00')),
-                        category=category or 'general'
-                    ))
-                except KeyError as e:
-                    self.logger.warning(f"Skipping article due to missing field: {e}")
-                    continue
-                    
+            raw_articles = _json_loads(response.content)['articles'][:max_results]
+            article_category = category or 'general'
+            articles = [
+                article for article in (self._parse_article(raw, article_category) for raw in raw_articles)
+                if article is not None
+            ]
+            
+            self._cache_store(cache_key, articles, _HEADLINES_TTL)
             return articles
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:  # ValueError: malformed JSON
             self.logger.error(f"Error fetching news: {e}")
+            if cached:
+                self.logger.warning("Serving stale headlines from cache")
+                return cached[1]
             return []
             
+    def get_top_headlines_multi(self, categories: List[str], max_results: int = 5) -> Dict[str, List[NewsArticle]]:
+        """
+        Fetch top headlines for several categories in parallel.
+        """
+        if not categories:
+            return {}
+        
+        results = self._executor.map(lambda category: self.get_top_headlines(category, max_results), categories)
+        return dict(zip(categories, results))
+            
     def search_news(self, query: str, max_results: int = 5) -> List[NewsArticle]:
         """
         Search for news articles by query.
         """
+        cache_key = ('search', query, self.language, max_results)
+        cached = self._cache_lookup(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
             endpoint = f"{self.base_url}/everything"
             params = {
@@ -78,30 +188,67 @@ class NewsService:
                 'sortBy': 'relevancy'
             }
             
-            response = requests.get(endpoint, params=params)
+            response = self.session.get(endpoint, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            articles = []
-            for article in response.json()['articles'][:max_results]:
-                try:
-                    articles.append(NewsArticle(
-                        title=article['title'],
-                        description=article.get('description', ''),
-                        url=article['url'],
-                        source=article['source']['name'],
-                        published_at=datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00')),
-                        category='search'
-                    ))
-                except KeyError as e:
-                    self.logger.warning(f"Skipping article due to missing field: {e}")
-                    continue
-                    
+            raw_articles = _json_loads(response.content)['articles'][:max_results]
+            article_category = 'search'
+            articles = [
+                article for article in (self._parse_article(raw, article_category) for raw in raw_articles)
+                if article is not None
+            ]
+            
+            self._cache_store(cache_key, articles, _SEARCH_TTL)
             return articles
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:  # ValueError: malformed JSON
             self.logger.error(f"Error searching news: {e}")
+            if cached:
+                self.logger.warning("Serving stale search results from cache")
+                return cached[1]
             return []
     
+    def _parse_article(self, raw: dict, category: str) -> Optional[NewsArticle]:
+        """
+        Build a NewsArticle from a NewsAPI article, or None if a field is missing.
+        """
+        try:
+            return NewsArticle(
+                title=raw['title'],
+                description=raw.get('description', ''),
+                url=raw['url'],
+                source=raw['source']['name'],
+                # fromisoformat is implemented in C; only the 'Z' suffix needs rewriting
+                published_at=datetime.fromisoformat(raw['publishedAt'].replace('Z', '+00:00')),
+                category=category
+            )
+        except KeyError as e:
+            self.logger.warning(f"Skipping article due to missing field: {e}")
+            return None
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking request on the fetch workers so the event loop stays free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+    
+    async def aget_top_headlines(self, category: str = None, max_results: int = 5) -> List[NewsArticle]:
+        """Async variant of get_top_headlines."""
+        return await self._run_blocking(self.get_top_headlines, category, max_results)
+    
+    async def asearch_news(self, query: str, max_results: int = 5) -> List[NewsArticle]:
+        """Async variant of search_news."""
+        return await self._run_blocking(self.search_news, query, max_results)
+    
+    async def aget_article_summary(self, url: str) -> Optional[str]:
+        """Async variant of get_article_summary."""
+        return await self._run_blocking(self.get_article_summary, url)
+    
+    async def summarize_many(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Summarize several articles concurrently; results keep the order of urls.
+        """
+        return list(await asyncio.gather(*(self.aget_article_summary(url) for url in urls)))
+    
     def format_articles_response(self, articles: List[NewsArticle], detailed: bool = False) -> str:
         """
         Format articles into a readable response.
@@ -109,31 +256,18 @@ class NewsService:
         if not articles:
             return "Üzgünüm, hiç haber bulunamadı."
             
-        category_names = {
-            'business': 'İş',
-            'entertainment': 'Eğlence',
-            'health': 'Sağlık',
-            'science': 'Bilim',
-            'sports': 'Spor',
-            'technology': 'Teknoloji',
-            'general': 'Genel',
-            'search': 'Arama Sonuçları'
-        }
-        
-        category = category_names.get(articles[0].category, 'Haberler')
+        category = _CATEGORY_NAMES.get(articles[0].category, 'Haberler')
         response = [f"\n{category} Haberleri:"]
         
+        append = response.append
         for i, article in enumerate(articles, 1):
-            published = article.published_at.strftime('%H:%M')
+            published_at = article.published_at
+            append(f"\n{i}. {article.title}")
+            if detailed and article.description:
+                append(f"   {article.description}")
+            append(f"   Kaynak: {article.source} - Saat: {published_at.hour:02d}:{published_at.minute:02d}")
             if detailed:
-                response.append(f"\n{i}. {article.title}")
-                if article.description:
-                    response.append(f"   {article.description}")
-                response.append(f"   Kaynak: {article.source} - Saat: {published}")
-                response.append(f"   Link: {article.url}\n")
-            else:
-                response.append(f"\n{i}. {article.title}")
-                response.append(f"   Kaynak: {article.source} - Saat: {published}")
+                append(f"   Link: {article.url}\n")
         
         return "\n".join(response)
     
@@ -141,34 +275,78 @@ class NewsService:
         """
         Get a summary of a specific article by URL.
         """
+        cache_key = ('summary', url)
+        cached = self._cache_lookup(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
-            response = requests.get(url)
+            response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Try to find the main article content
-            article_text = ""
-            
-            # Look for common article content containers
-            content_tags = soup.find_all(['article', 'main', 'div'], class_=['content', 'article-content', 'post-content'])
-            
-            if content_tags:
-                # Get text from paragraphs in the first matching container
-                paragraphs = content_tags[0].find_all('p')
-                article_text = ' '.join(p.get_text().strip() for p in paragraphs)
-            
-            if not article_text:
-                # Fallback: just get all paragraphs
-                paragraphs = soup.find_all('p')
-                article_text = ' '.join(p.get_text().strip() for p in paragraphs[:5])
+            if LexborHTMLParser is not None:
+                article_text = self._extract_text_lexbor(response.text)
+            else:
+                article_text = self._extract_text_bs4(response)
             
             # Truncate if too long
             if len(article_text) > 500:
                 article_text = article_text[:497] + "..."
                 
-            return article_text if article_text else None
+            if not article_text:
+                return None
+            
+            self._cache_store(cache_key, article_text, _SUMMARY_TTL)
+            return article_text
             
         except Exception as e:
             self.logger.error(f"Error getting article summary: {e}")
-            return None 
\ No newline at end of file
+            return cached[1] if cached else None
+    
+    @staticmethod
+    def _extract_text_lexbor(html: str) -> str:
+        """Extract article text with selectolax's Lexbor parser."""
+        tree = LexborHTMLParser(html)
+        article_text = ""
+        
+        # Look for common article content containers
+        content_node = tree.css_first(_CONTENT_SELECTOR)
+        if content_node is not None:
+            article_text = ' '.join(p.text().strip() for p in content_node.css('p'))
+        
+        if not article_text:
+            # Fallback: just get all paragraphs
+            article_text = ' '.join(p.text().strip() for p in tree.css('p')[:5])
+        
+        return article_text
+    
+    @staticmethod
+    def _make_soup(response: requests.Response, strainer: SoupStrainer) -> BeautifulSoup:
+        """Parse only the strained parts of a page (lxml, or html.parser as a last resort)."""
+        # lxml is C-backed; pass raw bytes so it can sniff the encoding
+        try:
+            return BeautifulSoup(response.content, 'lxml', parse_only=strainer)
+        except FeatureNotFound:
+            return BeautifulSoup(response.text, 'html.parser', parse_only=strainer)
+    
+    @classmethod
+    def _extract_text_bs4(cls, response: requests.Response) -> str:
+        """Extract article text with BeautifulSoup."""
+        article_text = ""
+        
+        # Look for common article content containers
+        content_tags = cls._make_soup(response, _CONTENT_STRAINER).find_all(
+            list(_CONTENT_TAGS), class_=list(_CONTENT_CLASSES)
+        )
+        
+        if content_tags:
+            # Get text from paragraphs in the first matching container
+            paragraphs = content_tags[0].find_all('p')
+            article_text = ' '.join(p.get_text().strip() for p in paragraphs)
+        
+        if not article_text:
+            # Fallback: re-parse keeping just the paragraphs
+            paragraphs = cls._make_soup(response, _PARAGRAPH_STRAINER).find_all('p', limit=5)
+            article_text = ' '.join(p.get_text().strip() for p in paragraphs)
+        
+        return article_text 
\ No newline at end of file
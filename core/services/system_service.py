@@ -3,41 +3,140 @@ System service for handling system operations like launching applications and pl
 """
 
 import os
+import re
+import sys
+import ctypes
+import struct
+from ctypes import wintypes
+import atexit
+import functools
+import shutil
 import subprocess
+import threading
+import time
 import platform
 import logging
 from pathlib import Path
 import winreg
-from typing import Optional, List, Dict
+from typing import Any, Iterator, Optional, List, Dict, Set, Tuple
 import pygame
 import json
 import glob
 import psutil
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import pythoncom  # COM için gerekli
-import traceback
 
-@dataclass
+from . import _DATACLASS_SLOTS
+
+# Prefer orjson for JSON parsing when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Start Menu'de taranacak popüler uygulamalar
+_POPULAR_KEYWORDS = (
+    'chrome', 'firefox', 'edge', 'word', 'excel', 'powerpoint',
+    'outlook', 'spotify', 'steam', 'discord', 'teams', 'code',
+    'visual studio', 'notepad', 'paint', 'calculator'
+)
+_POPULAR_KEYWORD_RE = re.compile("|".join(map(re.escape, _POPULAR_KEYWORDS)))
+
+class _VS_FIXEDFILEINFO(ctypes.Structure):
+    """VS_FIXEDFILEINFO (winver.h)"""
+    _fields_ = [(name, wintypes.DWORD) for name in (
+        'dwSignature', 'dwStrucVersion', 'dwFileVersionMS', 'dwFileVersionLS',
+        'dwProductVersionMS', 'dwProductVersionLS', 'dwFileFlagsMask', 'dwFileFlags',
+        'dwFileOS', 'dwFileType', 'dwFileSubtype', 'dwFileDateMS', 'dwFileDateLS'
+    )]
+
+# MS-SHLLINK: ShellLinkHeader ve LinkInfo alanları
+_LNK_HEADER = struct.Struct('<I16sIIQQQIIIHHII')
+_LNK_LINKINFO = struct.Struct('<IIIIIII')
+_LNK_HAS_ID_LIST = 0x1
+_LNK_HAS_LINK_INFO = 0x2
+_LNK_VOLUME_ID_AND_LOCAL_BASE_PATH = 0x1
+_ANSI_CODEC = 'mbcs' if sys.platform == 'win32' else 'latin-1'
+
+# Önbellek dosyalarının biçimi değişince artırılır; eski dosyalar yok sayılır
+_CACHE_VERSION = 2
+
+# Kısayol çözümlemesi için iş parçacığı sayısı
+_SHORTCUT_WORKERS = 16
+
+# Çalışan process listesi bu süre boyunca yeniden kullanılır
+_PROCESS_SNAPSHOT_TTL = 1.0  # seconds
+
+_MUSIC_EXTS = ('.mp3', '.wav', '.ogg')
+_MUSIC_INDEX_TTL = 60.0  # seconds
+
+# Uygulama yolu bulunamazsa program klasörlerinde sınırlı derin arama yapılır (LAZZARAN_DEEP_SCAN=0 kapatır)
+_DEEP_SCAN_MAX_DEPTH = 3
+# Directory names that never hold launchable executables but can be huge
+_DEEP_SCAN_SKIP_DIRS = frozenset({'node_modules', '.git', 'cache', 'temp', 'windowsapps'})
+
+_APP_PATHS_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class VersionInfo:
+    """Raw version resource fields; display text is built on demand"""
+    description: str
+    version: Tuple[int, int, int, int]
+
+    @property
+    def version_str(self) -> str:
+        return ".".join(map(str, self.version))
+
+    @property
+    def description_str(self) -> str:
+        if self.description:
+            return f"{self.description} (v{self.version_str})"
+        return f"Version {self.version_str}"
+
+@dataclass(**_DATACLASS_SLOTS)
 class ApplicationInfo:
     name: str
     exe_name: str
     path: str
     is_running: bool
-    description: str = ""
+    version_info: Optional[VersionInfo] = None
     icon_path: str = ""
 
+    @property
+    def description(self) -> str:
+        return self.version_info.description_str if self.version_info else ""
+
 class SystemService:
     def __init__(self, config_path: str = "config/system_paths.json", voice_assistant=None):
         self.logger = logging.getLogger(__name__)
         pygame.mixer.init()
         self.config_path = config_path
         self.system = platform.system()
-        self.app_paths = self._load_app_paths()
-        self.music_paths = self._load_music_paths()
+        self._config = self._load_config()
+        self.app_paths = self._config.get('applications', {})
+        self.music_paths = self._config.get('music_directories', [])
+        self._music_index: Dict[str, str] = {}  # lowercase file name -> full path
+        self._music_index_time: Optional[float] = None
         self.running_apps: Dict[str, subprocess.Popen] = {}
         self.discovered_apps: Dict[str, ApplicationInfo] = {}
+        self._proc_snapshot: Optional[Tuple[float, Set[str]]] = None
         self.voice_assistant = voice_assistant
-        pythoncom.CoInitialize()  # COM'u başlat
+        
+        # Sürüm bilgisi önbelleği: path -> (mtime, VersionInfo | None)
+        self._desc_cache_path = os.path.join(os.path.dirname(config_path), "file_desc_cache.json")
+        self._desc_cache: Dict[str, Tuple[float, Optional[VersionInfo]]] = {
+            path: (mtime, VersionInfo(value[0], tuple(value[1])) if value else None)
+            for path, (mtime, value) in self._load_json_cache(self._desc_cache_path).items()
+        }
+        self._desc_cache_dirty = False
+        atexit.register(self._save_desc_cache)
+        
+        # Kısayol hedefi önbelleği: .lnk path -> (lnk mtime, target path)
+        self._apps_cache_path = os.path.join(os.path.dirname(config_path), "apps_cache.json")
+        self._lnk_cache: Dict[str, Tuple[float, str]] = self._load_json_cache(self._apps_cache_path)
+        self._lnk_cache_dirty = False
         
         # Common Windows application paths
         self._COMMON_APPS = {
@@ -58,16 +157,10 @@ class SystemService:
             "Teams.exe": "C:\\Users\\%USERNAME%\\AppData\\Local\\Microsoft\\Teams\\current\\Teams.exe"
         }
         
-        # Start initial scan
-        self._initial_scan()
+        # Start initial scan in the background so construction returns immediately
+        self._scan_done = threading.Event()
+        threading.Thread(target=self._initial_scan, name="app-scan", daemon=True).start()
         
-    def __del__(self):
-        """Cleanup when object is destroyed"""
-        try:
-            pythoncom.CoUninitialize()  # COM'u temizle
-        except:
-            pass
-    
     def _initial_scan(self):
         """Initial scan for applications"""
         try:
@@ -78,14 +171,20 @@ class SystemService:
                 
             # Scan for applications
             self._scan_for_applications()
+            self._save_desc_cache()
             
         except Exception as e:
             self.logger.error(f"Application scan error: {e}")
+        finally:
+            self._scan_done.set()
     
     def _scan_for_applications(self):
         """Sistemde yüklü uygulamaları tara"""
         try:
-            self.discovered_apps.clear()
+            discovered: Dict[str, ApplicationInfo] = {}
+            
+            # Çalışan process'lerin tek bir anlık görüntüsü
+            running = self._running_names_snapshot()
             
             # Temel sistem uygulamaları
             basic_apps = {
@@ -98,18 +197,6 @@ class SystemService:
                 "control.exe": "C:\\Windows\\System32\\control.exe",
             }
             
-            # Temel uygulamaları ekle
-            for exe_name, path in basic_apps.items():
-                if os.path.exists(path):
-                    name = os.path.splitext(exe_name)[0].title()
-                    self.discovered_apps[exe_name] = ApplicationInfo(
-                        name=name,
-                        exe_name=exe_name,
-                        path=path,
-                        is_running=self._is_process_running(exe_name),
-                        description=self._get_file_description(path)
-                    )
-            
             # Yaygın program dizinleri
             common_paths = [
                 os.path.join(os.environ.get('PROGRAMFILES', ''), "Google\\Chrome\\Application\\chrome.exe"),
@@ -122,17 +209,32 @@ class SystemService:
                 os.path.join(os.environ.get('LOCALAPPDATA', ''), "Programs\\Microsoft VS Code\\Code.exe")
             ]
             
+            # Aday yollar dizin başına tek bir listelemeyle kontrol edilir
+            existing = self._existing_paths(list(basic_apps.values()) + common_paths)
+            
+            # Temel uygulamaları ekle
+            for exe_name, path in basic_apps.items():
+                if path in existing:
+                    name = os.path.splitext(exe_name)[0].title()
+                    discovered[exe_name] = ApplicationInfo(
+                        name=name,
+                        exe_name=exe_name,
+                        path=path,
+                        is_running=exe_name in running,
+                        version_info=self._get_version_info(path)
+                    )
+            
             # Yaygın uygulamaları ekle
             for path in common_paths:
-                if os.path.exists(path):
+                if path in existing:
                     exe_name = os.path.basename(path).lower()
                     name = os.path.splitext(exe_name)[0].title()
-                    self.discovered_apps[exe_name] = ApplicationInfo(
+                    discovered[exe_name] = ApplicationInfo(
                         name=name,
                         exe_name=exe_name,
                         path=path,
-                        is_running=self._is_process_running(exe_name),
-                        description=self._get_file_description(path)
+                        is_running=exe_name in running,
+                        version_info=self._get_version_info(path)
                     )
             
             # Start Menu'den sadece popüler uygulamaları tara
@@ -141,93 +243,281 @@ class SystemService:
                 os.path.join(os.environ['PROGRAMDATA'], "Microsoft\\Windows\\Start Menu\\Programs")
             ]
             
-            popular_keywords = [
-                'chrome', 'firefox', 'edge', 'word', 'excel', 'powerpoint',
-                'outlook', 'spotify', 'steam', 'discord', 'teams', 'code',
-                'visual studio', 'notepad', 'paint', 'calculator'
-            ]
-            
+            # Önce aday kısayolları topla (ucuz), sonra paralel çözümle
+            shortcuts = []
             for start_menu in start_menu_paths:
-                if os.path.exists(start_menu):
-                    for root, _, files in os.walk(start_menu):
-                        for file in files:
-                            if file.endswith('.lnk'):
-                                # Sadece popüler uygulamaları kontrol et
-                                if any(keyword in file.lower() for keyword in popular_keywords):
-                                    try:
-                                        import win32com.client
-                                        shell = win32com.client.Dispatch("WScript.Shell")
-                                        shortcut = shell.CreateShortCut(os.path.join(root, file))
-                                        target_path = shortcut.Targetpath
-                                        
-                                        if target_path and os.path.exists(target_path) and target_path.lower().endswith('.exe'):
-                                            exe_name = os.path.basename(target_path).lower()
-                                            if exe_name not in self.discovered_apps:
-                                                name = os.path.splitext(file)[0]
-                                                self.discovered_apps[exe_name] = ApplicationInfo(
-                                                    name=name,
-                                                    exe_name=exe_name,
-                                                    path=target_path,
-                                                    is_running=self._is_process_running(exe_name),
-                                                    description=self._get_file_description(target_path)
-                                                )
-                                    except Exception as e:
-                                        self.logger.warning(f"Error processing shortcut {file}: {e}")
-            
-            self.logger.info(f"Discovered {len(self.discovered_apps)} applications")
+                for path, name in self._iter_files(start_menu, ('.lnk',)):
+                    # Sadece popüler uygulamaları kontrol et
+                    if _POPULAR_KEYWORD_RE.search(name):
+                        shortcuts.append(path)
+            
+            if shortcuts:
+                with ThreadPoolExecutor(max_workers=min(_SHORTCUT_WORKERS, len(shortcuts))) as pool:
+                    resolved = list(pool.map(self._app_from_shortcut, shortcuts))
+                
+                # Walk sırasını koru: aynı exe için ilk kısayol kazanır
+                for app_info in resolved:
+                    if app_info and app_info.exe_name not in discovered:
+                        app_info.is_running = app_info.exe_name in running
+                        discovered[app_info.exe_name] = app_info
+            
+            # Artık var olmayan kısayolları önbellekten çıkar
+            stale = self._lnk_cache.keys() - set(shortcuts)
+            if stale:
+                for lnk_path in stale:
+                    del self._lnk_cache[lnk_path]
+                self._lnk_cache_dirty = True
+            
+            if self._lnk_cache_dirty and self._save_json_cache(self._apps_cache_path, self._lnk_cache):
+                self._lnk_cache_dirty = False
+            
+            # Okuyucular yarım bir liste görmesin diye tek seferde değiştir
+            self.discovered_apps = discovered
+            self.logger.info(f"Discovered {len(discovered)} applications")
             
         except Exception as e:
             self.logger.error(f"Error scanning for applications: {e}")
     
+    def _app_from_shortcut(self, lnk_path: str) -> Optional[ApplicationInfo]:
+        """Kısayolu çözümle ve bir .exe'ye işaret ediyorsa ApplicationInfo döndür"""
+        try:
+            target_path = self._resolve_shortcut(lnk_path)
+            if target_path and os.path.exists(target_path) and target_path.lower().endswith('.exe'):
+                return ApplicationInfo(
+                    name=os.path.splitext(os.path.basename(lnk_path))[0],
+                    exe_name=os.path.basename(target_path).lower(),
+                    path=target_path,
+                    is_running=False,
+                    version_info=self._get_version_info(target_path)
+                )
+        except Exception as e:
+            self.logger.warning(f"Error processing shortcut {os.path.basename(lnk_path)}: {e}")
+        return None
+    
+    @staticmethod
+    def _existing_paths(paths: List[str]) -> Set[str]:
+        """Return the subset of paths that exist, listing each shared parent directory once"""
+        by_parent: Dict[str, List[str]] = {}
+        for path in paths:
+            by_parent.setdefault(os.path.dirname(path), []).append(path)
+        
+        existing = set()
+        for parent, children in by_parent.items():
+            if len(children) == 1:
+                if os.path.exists(children[0]):
+                    existing.add(children[0])
+                continue
+            try:
+                with os.scandir(parent) as entries:
+                    names = {entry.name.lower() for entry in entries}
+            except OSError:
+                continue
+            existing.update(path for path in children if os.path.basename(path).lower() in names)
+        return existing
+    
     def _is_process_running(self, exe_name: str) -> bool:
         """Belirtilen uygulamanın çalışıp çalışmadığını kontrol et"""
+        return exe_name.lower() in self._running_names_snapshot()
+    
+    def _running_names_snapshot(self) -> Set[str]:
+        """Çalışan tüm process isimlerini (küçük harf) tek geçişte topla
+        
+        Sonuç kısa bir süre (_PROCESS_SNAPSHOT_TTL) önbellekte tutulur.
+        """
+        now = time.monotonic()
+        snapshot = self._proc_snapshot
+        if snapshot and now - snapshot[0] < _PROCESS_SNAPSHOT_TTL:
+            return snapshot[1]
+        
         try:
-            exe_name = exe_name.lower()
-            for proc in psutil.process_iter(['name']):
-                if proc.info['name'].lower() == exe_name:
-                    return True
-            return False
+            names = {
+                proc.info['name'].lower()
+                for proc in psutil.process_iter(['name'])
+                if proc.info['name']
+            }
         except Exception as e:
             self.logger.error(f"Error checking process status: {e}")
+            return set()
+        
+        self._proc_snapshot = (now, names)
+        return names
+    
+    def _load_json_cache(self, cache_path: str) -> Dict[str, Tuple[float, Any]]:
+        """path -> (mtime, value) biçimindeki bir önbellek dosyasını yükle"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != _CACHE_VERSION:
+                return {}
+            return {path: (mtime, value) for path, (mtime, value) in data['entries'].items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+            return {}
+    
+    def _save_json_cache(self, cache_path: str, cache: Dict[str, Tuple[float, Any]]) -> bool:
+        """Önbelleği diske yaz"""
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _CACHE_VERSION, 'entries': cache}, f, ensure_ascii=False)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Error saving cache {cache_path}: {e}")
             return False
     
-    def _get_file_description(self, file_path: str) -> str:
-        """Dosya açıklamasını al"""
+    def _save_desc_cache(self):
+        """Sürüm bilgisi önbelleğini diske yaz"""
+        if not self._desc_cache_dirty:
+            return
+        # Tarama thread'leri yazarken de çağrılabilir: önce bayrağı indir, sonra anlık kopyayı yaz
+        self._desc_cache_dirty = False
+        entries = {
+            path: (mtime, [info.description, list(info.version)] if info else None)
+            for path, (mtime, info) in list(self._desc_cache.items())
+        }
+        if not self._save_json_cache(self._desc_cache_path, entries):
+            self._desc_cache_dirty = True
+    
+    def _resolve_shortcut(self, lnk_path: str) -> str:
+        """Kısayolun hedefini döndür; .lnk değişmediyse önbellekten"""
+        lnk_mtime = os.path.getmtime(lnk_path)
+        cached = self._lnk_cache.get(lnk_path)
+        if cached and cached[0] == lnk_mtime:
+            return cached[1]
+        
+        target_path = self._parse_lnk_target(lnk_path)
+        if not target_path:
+            # Yerel yol içermeyen kısayollar (ör. MSI "advertised") için COM'a başvur
+            target_path = self._com_shortcut_target(lnk_path)
+        
+        self._lnk_cache[lnk_path] = (lnk_mtime, target_path)
+        self._lnk_cache_dirty = True
+        return target_path
+    
+    @staticmethod
+    def _com_shortcut_target(lnk_path: str) -> str:
+        """Kısayol hedefini WScript.Shell ile oku; COM bu çağrı süresince başlatılıp kapatılır"""
+        shell = shortcut = None
+        pythoncom.CoInitialize()
+        try:
+            import win32com.client
+            shell = win32com.client.Dispatch("WScript.Shell")
+            shortcut = shell.CreateShortCut(lnk_path)
+            return shortcut.Targetpath
+        finally:
+            # COM nesneleri CoUninitialize'dan önce bırakılmalı
+            shortcut = shell = None
+            pythoncom.CoUninitialize()
+    
+    @staticmethod
+    def _parse_lnk_target(lnk_path: str) -> Optional[str]:
+        """.lnk dosyasındaki yerel hedef yolu COM kullanmadan oku (MS-SHLLINK)"""
+        def read_string(data: bytes, position: int, unicode: bool) -> str:
+            if not unicode:
+                return data[position:data.index(b'\0', position)].decode(_ANSI_CODEC)
+            end = position
+            while end + 1 < len(data) and data[end:end + 2] != b'\0\0':
+                end += 2
+            return data[position:end].decode('utf-16-le')
+        
         try:
-            import win32api
-            info = win32api.GetFileVersionInfo(file_path, '\\')
-            ms = info['FileVersionMS']
-            ls = info['FileVersionLS']
-            version = f"{win32api.HIWORD(ms)}.{win32api.LOWORD(ms)}.{win32api.HIWORD(ls)}.{win32api.LOWORD(ls)}"
+            with open(lnk_path, 'rb') as f:
+                data = f.read()
+            
+            header_size, _, link_flags = _LNK_HEADER.unpack_from(data)[:3]
+            if header_size != _LNK_HEADER.size or not link_flags & _LNK_HAS_LINK_INFO:
+                return None
+            
+            offset = header_size
+            if link_flags & _LNK_HAS_ID_LIST:
+                offset += 2 + struct.unpack_from('<H', data, offset)[0]
+            
+            (_, info_header_size, info_flags, _, base_path_offset,
+             _, suffix_offset) = _LNK_LINKINFO.unpack_from(data, offset)
+            if not info_flags & _LNK_VOLUME_ID_AND_LOCAL_BASE_PATH:
+                return None
+            
+            # Unicode yollar mevcutsa onları kullan
+            unicode = info_header_size >= 0x24
+            if unicode:
+                base_path_offset, suffix_offset = struct.unpack_from('<II', data, offset + _LNK_LINKINFO.size)
+            
+            target = (read_string(data, offset + base_path_offset, unicode)
+                      + read_string(data, offset + suffix_offset, unicode))
+            return target or None
+        except (OSError, struct.error, ValueError, UnicodeDecodeError):
+            return None
+    
+    def _get_version_info(self, file_path: str) -> Optional[VersionInfo]:
+        """Dosya sürüm bilgisini al (path + mtime ile önbelleklenir)"""
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            return None
+        
+        cached = self._desc_cache.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        info = self._read_version_info(file_path)
+        self._desc_cache[file_path] = (mtime, info)
+        self._desc_cache_dirty = True
+        return info
+    
+    def _read_version_info(self, file_path: str) -> Optional[VersionInfo]:
+        """Dosya sürüm bilgisini (açıklama + sürüm) oku
+        
+        Sürüm kaynağı tek bir GetFileVersionInfoW çağrısıyla okunur; sürüm,
+        dil ve açıklama aynı tampondan VerQueryValueW ile sorgulanır.
+        """
+        try:
+            version_dll = ctypes.windll.version
+            size = version_dll.GetFileVersionInfoSizeW(file_path, None)
+            if not size:
+                return None
+            buffer = ctypes.create_string_buffer(size)
+            if not version_dll.GetFileVersionInfoW(file_path, 0, size, buffer):
+                return None
+            
+            value = ctypes.c_void_p()
+            length = wintypes.UINT()
+            if not version_dll.VerQueryValueW(buffer, '\\', ctypes.byref(value), ctypes.byref(length)):
+                return None
+            fixed = ctypes.cast(value, ctypes.POINTER(_VS_FIXEDFILEINFO)).contents
+            ms, ls = fixed.dwFileVersionMS, fixed.dwFileVersionLS
+            version = (ms >> 16, ms & 0xFFFF, ls >> 16, ls & 0xFFFF)
             
             # Dosya açıklamasını al
-            try:
-                lang, codepage = win32api.GetFileVersionInfo(file_path, '\\VarFileInfo\\Translation')[0]
+            if (version_dll.VerQueryValueW(buffer, '\\VarFileInfo\\Translation', ctypes.byref(value), ctypes.byref(length))
+                    and length.value >= ctypes.sizeof(wintypes.WORD * 2)):
+                lang, codepage = ctypes.cast(value, ctypes.POINTER(wintypes.WORD * 2)).contents
                 string_file_info = f'\\StringFileInfo\\{lang:04x}{codepage:04x}\\FileDescription'
-                description = win32api.GetFileVersionInfo(file_path, string_file_info)
-                return f"{description} (v{version})"
-            except:
-                return f"Version {version}"
-        except:
-            return ""
+                if version_dll.VerQueryValueW(buffer, string_file_info, ctypes.byref(value), ctypes.byref(length)):
+                    return VersionInfo(ctypes.wstring_at(value, length.value).rstrip('\0'), version)
+            return VersionInfo("", version)
+        except Exception:
+            return None
     
     def get_running_applications(self) -> List[ApplicationInfo]:
         """Çalışan uygulamaları listele"""
+        self._scan_done.wait()
         running_apps = []
+        running = self._running_names_snapshot()
         for app_info in self.discovered_apps.values():
-            if self._is_process_running(app_info.exe_name):
-                app_info.is_running = True
+            app_info.is_running = app_info.exe_name.lower() in running
+            if app_info.is_running:
                 running_apps.append(app_info)
-            else:
-                app_info.is_running = False
         return running_apps
     
     def get_available_applications(self) -> List[ApplicationInfo]:
         """Kullanılabilir tüm uygulamaları listele"""
+        self._scan_done.wait()
         return list(self.discovered_apps.values())
     
     def launch_application(self, app_name: str) -> bool:
         """Launch an application by name"""
+        self._scan_done.wait()
         try:
             app_name = app_name.lower()
             
@@ -282,19 +572,24 @@ class SystemService:
     
     def terminate_application(self, exe_name: str) -> bool:
         """Uygulamayı sonlandır"""
+        self._scan_done.wait()
         try:
             exe_name = exe_name.lower()
             if exe_name in self.discovered_apps:
                 app_info = self.discovered_apps[exe_name]
-                if app_info.is_running:
-                    # Önce process'i bul
+                if app_info.is_running and exe_name in self._running_names_snapshot():
+                    # Tek geçişte eşleşen tüm process'leri sonlandır
+                    terminated = False
                     for proc in psutil.process_iter(['name']):
-                        if proc.info['name'].lower() == exe_name:
+                        name = proc.info['name']
+                        if name and name.lower() == exe_name:
                             proc.terminate()
-                            app_info.is_running = False
-                            if exe_name in self.running_apps:
-                                del self.running_apps[exe_name]
-                            return True
+                            terminated = True
+                    if terminated:
+                        self._proc_snapshot = None
+                        app_info.is_running = False
+                        self.running_apps.pop(exe_name, None)
+                        return True
             return False
         except Exception as e:
             self.logger.error(f"Error terminating application {exe_name}: {e}")
@@ -302,34 +597,106 @@ class SystemService:
     
     def refresh_application_list(self):
         """Uygulama listesini yenile"""
+        self._scan_done.wait()
+        # Kısayolları yeniden çözümle
+        self._lnk_cache.clear()
         self._scan_for_applications()
+        self._save_desc_cache()
 
-    def _load_app_paths(self) -> dict:
-        """Load application paths from config file"""
+    def _load_config(self) -> dict:
+        """Load the system paths config file once"""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get('applications', {})
+            with open(self.config_path, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
             return {}
         except Exception as e:
-            self.logger.error(f"Error loading app paths: {e}")
+            self.logger.error(f"Error loading system paths config: {e}")
             return {}
 
-    def _load_music_paths(self) -> dict:
-        """Load music paths from config file"""
-        try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get('music_directories', [])
-            return []
-        except Exception as e:
-            self.logger.error(f"Error loading music paths: {e}")
-            return []
+    @functools.cached_property
+    def _app_paths_registry(self) -> Dict[str, str]:
+        """Windows App Paths table (exe name -> path), read once from both hives"""
+        table: Dict[str, str] = {}
+        # HKCU first so per-user registrations win over machine-wide ones
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                root = winreg.OpenKey(hive, _APP_PATHS_KEY)
+            except OSError:
+                continue
+            with root:
+                for i in range(winreg.QueryInfoKey(root)[0]):
+                    try:
+                        name = winreg.EnumKey(root, i)
+                        with winreg.OpenKey(root, name) as key:
+                            value, _ = winreg.QueryValueEx(key, None)
+                    except OSError:
+                        continue
+                    if isinstance(value, str) and value:
+                        table.setdefault(name.lower(), os.path.expandvars(value.strip('"')))
+        return table
+    
+    def _lookup_app_paths_registry(self, exe_name: str) -> Optional[str]:
+        """Look up an executable in the Windows App Paths registry key"""
+        path = self._app_paths_registry.get(exe_name.lower())
+        if path and os.path.exists(path):
+            return path
+        return None
+
+    @staticmethod
+    def _iter_files(root: str, suffixes: Tuple[str, ...]) -> Iterator[Tuple[str, str]]:
+        """Yield (path, lowercase name) for files under root ending in one of suffixes.
+        
+        Uses an explicit scandir stack so file entries are filtered by name
+        without a stat call, and unreadable directories are skipped.
+        """
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        name = entry.name.lower()
+                        if name.endswith(suffixes):
+                            yield entry.path, name
+            except OSError:
+                continue
 
-    def _find_application_path(self, app_name: str) -> Optional[str]:
-        """Find the path of an application by searching common locations"""
+    @staticmethod
+    def _deep_search(location: str, search_name: str, stop: Optional[threading.Event] = None,
+                     max_depth: int = _DEEP_SCAN_MAX_DEPTH) -> Optional[str]:
+        """Breadth-first search for search_name under location, at most max_depth levels down.
+        
+        Gives up before the next directory once stop is set.
+        """
+        level = [location]
+        for _ in range(max_depth):
+            next_level = []
+            for directory in level:
+                if stop is not None and stop.is_set():
+                    return None
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name.lower() not in _DEEP_SCAN_SKIP_DIRS:
+                                    next_level.append(entry.path)
+                            elif entry.name.lower() == search_name:
+                                return entry.path
+                except OSError:
+                    continue
+            level = next_level
+        return None
+
+    def _find_application_path(self, app_name: str, deep: Optional[bool] = None) -> Optional[str]:
+        """Find the path of an application by searching common locations.
+        
+        A bounded directory search is the last fallback. It runs unless deep
+        is False or, if deep is not given, LAZZARAN_DEEP_SCAN is set to 0.
+        """
         try:
             # Convert app name to lowercase for comparison
             app_name = app_name.lower()
@@ -349,6 +716,14 @@ class SystemService:
             if app_name in system_apps:
                 app_name = system_apps[app_name]
             
+            # If it's a .exe file, use it as is, otherwise append .exe
+            search_name = app_name if app_name.endswith('.exe') else f"{app_name}.exe"
+            
+            # Already found by the application scan
+            app_info = self.discovered_apps.get(search_name)
+            if app_info and os.path.exists(app_info.path):
+                return app_info.path
+            
             # Common program paths for specific applications
             specific_paths = {
                 "discord": [
@@ -387,32 +762,58 @@ class SystemService:
                         return path
             
             # Common locations to search
-            search_locations = [
+            program_locations = [
                 os.environ.get('PROGRAMFILES', ''),
                 os.environ.get('PROGRAMFILES(X86)', ''),
                 os.environ.get('LOCALAPPDATA', ''),
-                os.environ.get('APPDATA', ''),
+                os.environ.get('APPDATA', '')
+            ]
+            search_locations = program_locations + [
                 r"C:\Windows",
                 r"C:\Windows\System32"
             ]
             
-            # If it's a .exe file, use it as is, otherwise append .exe
-            search_name = app_name if app_name.endswith('.exe') else f"{app_name}.exe"
+            # PATH and App Paths lookups (no directory walk)
+            which_path = shutil.which(search_name)
+            if which_path:
+                return which_path
+            
+            registry_path = self._lookup_app_paths_registry(search_name)
+            if registry_path:
+                return registry_path
             
-            # Search in common locations
+            # Try direct paths in common locations
             for location in search_locations:
                 if not location:
                     continue
-                    
-                # First try direct path
                 direct_path = os.path.join(location, search_name)
                 if os.path.exists(direct_path):
                     return direct_path
-                    
-                # Then search in subdirectories
-                for root, dirs, files in os.walk(location):
-                    if search_name.lower() in (f.lower() for f in files):
-                        return os.path.join(root, search_name)
+            
+            if deep is None:
+                deep = os.environ.get('LAZZARAN_DEEP_SCAN', '1') != '0'
+            if not deep:
+                return None
+            
+            # Search program directories only; the Windows directories were checked directly above.
+            # The roots are independent, so they are walked in parallel; results keep their priority order.
+            roots = [location for location in program_locations if location]
+            if not roots:
+                return None
+            # Set once this lookup returns, so the remaining walkers stop instead of finishing their roots
+            stop = threading.Event()
+            pool = ThreadPoolExecutor(max_workers=len(roots), thread_name_prefix="deep-scan")
+            try:
+                for found in pool.map(self._deep_search, roots, [search_name.lower()] * len(roots),
+                                      [stop] * len(roots)):
+                    if found:
+                        return found
+            finally:
+                stop.set()
+                if sys.version_info >= (3, 9):
+                    pool.shutdown(wait=False, cancel_futures=True)
+                else:
+                    pool.shutdown(wait=False)
                         
             return None
             
@@ -420,16 +821,36 @@ class SystemService:
             self.logger.error(f"Error finding application path: {e}")
             return None
 
+    def _build_music_index(self) -> Dict[str, str]:
+        """Walk configured music directories once and index playable files"""
+        index: Dict[str, str] = {}
+        for music_dir in self.music_paths:
+            for path, name in self._iter_files(music_dir, _MUSIC_EXTS):
+                index.setdefault(name, path)
+        self.logger.info(f"Indexed {len(index)} music files")
+        return index
+
+    def _ensure_music_index(self, ttl: float = _MUSIC_INDEX_TTL):
+        """Rebuild the music index if it is missing or older than ttl seconds"""
+        now = time.monotonic()
+        if self._music_index_time is None or now - self._music_index_time > ttl:
+            self._music_index = self._build_music_index()
+            self._music_index_time = now
+
     def _find_music_file(self, music_name: str) -> Optional[str]:
         """Find a music file in configured music directories"""
         try:
-            for music_dir in self.music_paths:
-                if os.path.exists(music_dir):
-                    for root, _, files in os.walk(music_dir):
-                        for file in files:
-                            if any(file.lower().endswith(ext) for ext in ['.mp3', '.wav', '.ogg']):
-                                if music_name.lower() in file.lower():
-                                    return os.path.join(root, file)
+            self._ensure_music_index()
+            query = music_name.lower()
+            
+            # Exact file name first, then substring match over indexed names
+            for ext in _MUSIC_EXTS:
+                path = self._music_index.get(query + ext)
+                if path:
+                    return path
+            for file_name, path in self._music_index.items():
+                if query in file_name:
+                    return path
             return None
         except Exception as e:
             self.logger.error(f"Error searching for music file: {e}")
@@ -462,10 +883,7 @@ class SystemService:
     def update_paths(self, app_paths: dict = None, music_paths: list = None):
         """Update application and music paths in config"""
         try:
-            config = {}
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+            config = self._config
 
             if app_paths is not None:
                 config['applications'] = app_paths
@@ -474,6 +892,7 @@ class SystemService:
             if music_paths is not None:
                 config['music_directories'] = music_paths
                 self.music_paths = music_paths
+                self._music_index_time = None  # Rebuilt on next lookup
 
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             with open(self.config_path, 'w', encoding='utf-8') as f:
@@ -495,5 +914,5 @@ class SystemService:
             else:
                 self.logger.debug("No voice assistant instance available")
         except Exception as e:
-            self.logger.error(f"Error stopping speech output: {e}\n{traceback.format_exc()}")
+            self.logger.exception("Error stopping speech output: %s", e)
             raise 
\ No newline at end of file
@@ -3,11 +3,23 @@ Weather service for fetching and formatting weather information.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+# (connect, read) timeouts for weather requests
+_REQUEST_TIMEOUT = (3, 5)
+
+# OpenWeather updates roughly every 10 minutes
+_WEATHER_TTL = 600.0  # seconds
+_CACHE_SIZE = 64
+
 @dataclass
 class WeatherInfo:
     temperature: float
@@ -23,11 +35,40 @@ class WeatherService:
         self.language = language
         self.logger = logging.getLogger(__name__)
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        
+        # Keep-alive session; transient 429/5xx responses are retried with backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, WeatherInfo]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def get_weather(self, city: str) -> Optional[WeatherInfo]:
         """
         Fetch weather information for a given city.
         """
+        cache_key = (city.lower(), self.language)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                self._cache.move_to_end(cache_key)
+                return cached[1]
+        
         try:
             params = {
                 'q': city,
@@ -36,12 +77,12 @@ class WeatherService:
                 'units': 'metric'
             }
             
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
             
-            return WeatherInfo(
+            weather = WeatherInfo(
                 temperature=data['main']['temp'],
                 condition=data['weather'][0]['description'],
                 humidity=data['main']['humidity'],
@@ -50,6 +91,14 @@ class WeatherService:
                 timestamp=datetime.now()
             )
             
+            with self._cache_lock:
+                self._cache[cache_key] = (time.monotonic() + _WEATHER_TTL, weather)
+                self._cache.move_to_end(cache_key)
+                if len(self._cache) > _CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            
+            return weather
+            
         except requests.RequestException as e:
             self.logger.error(f"Error fetching weather data: {e}")
             return None
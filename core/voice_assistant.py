@@ -9,13 +9,26 @@ import pygame
 import logging
 import sounddevice as sd
 import numpy as np
-from typing import Optional
-from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 import time
-import traceback
+import io
+import wave
+import hashlib
 import threading
 import queue
+import re
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from faster_whisper import WhisperModel
+except ImportError:  # Optional: local speech recognition
+    WhisperModel = None
+
+# Sentence boundaries used to pipeline synthesis of multi-sentence responses
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
 
 @dataclass
 class VoiceAssistantConfig:
@@ -23,16 +36,28 @@ class VoiceAssistantConfig:
     language: str = 'tr-TR'
     timeout: float = 5.0
     ambient_duration: float = 1.0
-    temp_audio_file: str = "temp_response.mp3"
+    tts_cache_dir: str = "cache/tts"
+    tts_cache_limit: int = 50 * 1024 * 1024  # bytes
+    sound_cache_max_file_size: int = 32 * 1024  # mp3 bytes; roughly 8 s of gTTS speech
+    sound_cache_size: int = 32
     sample_rate: int = 16000
     channels: int = 1
     chunk_size: int = 1024
     max_retries: int = 3
     retry_delay: float = 0.5
-    energy_threshold: int = 4000
+    energy_threshold: int = 4000  # Starting speech threshold until the noise floor is measured
+    min_energy_threshold: float = 300.0  # The adaptive threshold never drops below this
+    min_speech_to_noise: float = 2.0  # Voiced RMS below this multiple of the noise floor is not sent for recognition
+    recognition_sample_rate: Optional[int] = None  # e.g. 8000 to halve upload size; None sends sample_rate
     pause_threshold: float = 0.8
     non_speaking_duration: float = 0.5
     dynamic_energy_threshold: bool = True
+    local_asr: bool = False  # Transcribe with faster-whisper before falling back to Google
+    local_asr_model: str = "base"
+    primary_lang: str = field(init=False)  # 'tr' for 'tr-TR'; used by gTTS and Whisper
+    
+    def __post_init__(self):
+        self.primary_lang = self.language.split('-')[0]
 
 class VoiceAssistant:
     """Main voice assistant class that handles speech recognition and synthesis."""
@@ -44,49 +69,55 @@ class VoiceAssistant:
             self.logger.info("Initializing voice assistant...")
             
             self.config = config or VoiceAssistantConfig()
-            self.logger.debug(f"Using configuration: {self.config}")
+            self.logger.debug("Using configuration: %s", self.config)
             
             self.recognizer = sr.Recognizer()
-            self._is_listening = False
-            self._is_speaking = False
-            self._lock = threading.Lock()
-            self._audio_queue = queue.Queue()
+            self._sound_cache: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
+            self._tts_lock = threading.Lock()  # Serializes synthesis and Sound cache updates
+            self._tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+            self._listening = threading.Event()
+            self._speaking = threading.Event()
+            self._audio_queue = queue.Queue()  # Raw PCM blocks from the input stream
+            self._input_stream: Optional[sd.InputStream] = None
             
             # Initialize audio system
             self._init_audio_system()
             
             # Configure speech recognition
             self._configure_recognition()
+            self._asr = self._init_local_asr() if self.config.local_asr else None
             
             self.logger.info("Voice assistant initialized successfully")
             
         except Exception as e:
-            self.logger.critical(f"Voice assistant initialization failed: {e}\n{traceback.format_exc()}")
+            self.logger.critical("Voice assistant initialization failed: %s", e, exc_info=True)
             raise
 
     @property
     def is_listening(self):
         """Thread-safe access to listening state."""
-        with self._lock:
-            return self._is_listening
+        return self._listening.is_set()
 
     @is_listening.setter
     def is_listening(self, value):
         """Thread-safe setting of listening state."""
-        with self._lock:
-            self._is_listening = value
+        if value:
+            self._listening.set()
+        else:
+            self._listening.clear()
 
     @property
     def is_speaking(self):
         """Thread-safe access to speaking state."""
-        with self._lock:
-            return self._is_speaking
+        return self._speaking.is_set()
 
     @is_speaking.setter
     def is_speaking(self, value):
         """Thread-safe setting of speaking state."""
-        with self._lock:
-            self._is_speaking = value
+        if value:
+            self._speaking.set()
+        else:
+            self._speaking.clear()
     
     def _init_audio_system(self):
         """Initialize the audio system for playback."""
@@ -95,9 +126,24 @@ class VoiceAssistant:
             if pygame.mixer.get_init():
                 pygame.mixer.quit()
             pygame.mixer.init(frequency=self.config.sample_rate)
+            
+            # Short cached phrases play as in-memory Sounds on a reserved channel
+            pygame.mixer.set_reserved(1)
+            self._speech_channel = pygame.mixer.Channel(0)
+            
+            # Post an event when playback ends so it can be awaited without polling
+            self._music_end_event = None
+            try:
+                pygame.display.init()  # Required by the event queue; no window is created
+                self._music_end_event = pygame.USEREVENT + 1
+                pygame.mixer.music.set_endevent(self._music_end_event)
+                self._speech_channel.set_endevent(self._music_end_event)
+            except pygame.error as e:
+                self.logger.warning(f"Playback end events unavailable, falling back to polling: {e}")
+            
             self.logger.debug("Audio system initialized successfully")
         except Exception as e:
-            self.logger.error(f"Audio system initialization failed: {e}\n{traceback.format_exc()}")
+            self.logger.exception("Audio system initialization failed: %s", e)
             raise
     
     def _configure_recognition(self):
@@ -108,67 +154,257 @@ class VoiceAssistant:
             self.recognizer.energy_threshold = self.config.energy_threshold
             self.recognizer.pause_threshold = self.config.pause_threshold
             self.recognizer.non_speaking_duration = self.config.non_speaking_duration
+            
+            # The capture loop gates on noise_floor * dynamic_energy_ratio, like sr.Recognizer.listen
+            self._noise_floor = self.config.energy_threshold / self.recognizer.dynamic_energy_ratio
             self.logger.debug("Speech recognition parameters configured successfully")
         except Exception as e:
-            self.logger.error(f"Speech recognition configuration failed: {e}\n{traceback.format_exc()}")
+            self.logger.exception("Speech recognition configuration failed: %s", e)
             raise
     
+    def _init_local_asr(self):
+        """Load the int8 faster-whisper model once, or return None to use Google only."""
+        if WhisperModel is None:
+            self.logger.warning("local_asr is enabled but faster-whisper is not installed; using Google")
+            return None
+        try:
+            self.logger.debug(f"Loading faster-whisper model '{self.config.local_asr_model}'...")
+            return WhisperModel(self.config.local_asr_model, device="cpu", compute_type="int8")
+        except Exception as e:
+            self.logger.error(f"Local speech recognition unavailable, using Google: {e}")
+            return None
+    
+    def _transcribe_locally(self, recording: bytes) -> Optional[str]:
+        """Transcribe 16-bit PCM with the local model; None means fall back to Google."""
+        try:
+            samples = np.frombuffer(recording, dtype=np.int16).astype(np.float32) / 32768.0
+            segments, _ = self._asr.transcribe(
+                samples,
+                language=self.config.primary_lang,
+                beam_size=1,
+                vad_filter=True
+            )
+            return "".join(segment.text for segment in segments).strip() or None
+        except Exception as e:
+            self.logger.warning(f"Local speech recognition failed, using Google: {e}")
+            return None
+    
     def start_listening(self):
         """Start the voice recognition."""
         self.logger.info("Starting voice recognition...")
+        self._open_input_stream()
         self.is_listening = True
+        self._calibrate_noise_floor()
         self.logger.debug("Voice recognition started successfully")
     
     def stop_listening(self):
         """Stop the voice recognition."""
         self.logger.info("Stopping voice recognition...")
         self.is_listening = False
+        self._close_input_stream()
+        self._audio_queue.put(b"")  # Unblock a recording waiting for audio
         self.logger.debug("Voice recognition stopped successfully")
     
+    def _open_input_stream(self):
+        """Open the microphone once and keep it running while listening is active."""
+        if self._input_stream is not None:
+            return
+        cfg = self.config
+        self._input_stream = sd.InputStream(
+            samplerate=cfg.sample_rate,
+            channels=cfg.channels,
+            dtype='int16',
+            blocksize=cfg.chunk_size,
+            callback=self._on_audio_block
+        )
+        self._input_stream.start()
+    
+    def _calibrate_noise_floor(self):
+        """Measure the ambient noise floor over config.ambient_duration seconds."""
+        cfg = self.config
+        if cfg.ambient_duration <= 0:
+            return
+        self._drain_audio_queue()
+        frames_needed = int(cfg.sample_rate * cfg.ambient_duration)
+        deadline = time.monotonic() + cfg.ambient_duration + 1.0
+        frames = 0
+        energies = []
+        
+        while self.is_listening and frames < frames_needed:
+            try:
+                block = self._audio_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if not block:
+                break
+            samples = np.frombuffer(block, dtype=np.int16)
+            frames += len(samples) // cfg.channels
+            energies.append(self._rms(samples))
+        
+        if energies:
+            # Median, so a single bump during calibration does not raise the floor
+            self._noise_floor = float(np.median(energies))
+            self.logger.debug("Noise floor %.0f, speech threshold %.0f",
+                              self._noise_floor, self._energy_threshold())
+    
+    def _close_input_stream(self):
+        """Stop and release the microphone stream, if open."""
+        stream, self._input_stream = self._input_stream, None
+        if stream is None:
+            return
+        try:
+            stream.stop()
+            stream.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing input stream: {e}")
+    
+    def _on_audio_block(self, indata, frames, time_info, status):
+        """PortAudio callback; indata is reused after returning, so queue a bytes copy."""
+        self._audio_queue.put(indata.tobytes())
+    
+    def _drain_audio_queue(self):
+        """Discard audio captured between listens (e.g. while the assistant was speaking)."""
+        try:
+            while True:
+                self._audio_queue.get_nowait()
+        except queue.Empty:
+            pass
+    
     def stop_speaking(self):
         """Stop the current speech output."""
         try:
             self.logger.info("Attempting to stop speech output...")
-            if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+            if pygame.mixer.get_init() and (pygame.mixer.music.get_busy() or self._speech_channel.get_busy()):
                 pygame.mixer.music.stop()
+                self._speech_channel.stop()
                 self.is_speaking = False
+                if self._music_end_event is not None:
+                    # Wake _wait_for_playback now instead of at its next timeout
+                    pygame.event.post(pygame.event.Event(self._music_end_event))
                 self.logger.debug("Speech output stopped successfully")
             else:
                 self.logger.debug("No active speech to stop")
         except Exception as e:
-            self.logger.error(f"Error stopping speech output: {e}\n{traceback.format_exc()}")
+            self.logger.exception("Error stopping speech output: %s", e)
+    
+    @staticmethod
+    def _rms(samples: np.ndarray) -> float:
+        """Root-mean-square energy of 16-bit samples (same scale as audioop.rms)."""
+        return float(np.sqrt(np.mean(np.square(samples, dtype=np.float32))))
+    
+    def _energy_threshold(self) -> float:
+        """Current speech threshold derived from the ambient noise floor."""
+        return max(self.config.min_energy_threshold, self._noise_floor * self.recognizer.dynamic_energy_ratio)
+    
+    def _record_until_silence(self) -> Optional[Tuple[bytes, float]]:
+        """Record from the microphone until speech is followed by a pause.
+        
+        config.timeout is only an upper bound: recording ends once the energy
+        has been below the speech threshold for config.pause_threshold
+        seconds after speech, or as soon as listening is stopped. While no
+        speech has been heard, the noise floor (and with it the threshold)
+        follows the ambient level when config.dynamic_energy_threshold is set.
+        
+        Only config.non_speaking_duration seconds of audio before the speech
+        onset are kept, and nothing is returned if no speech was heard.
+        
+        Returns the raw 16-bit PCM bytes, ready for sr.AudioData, and the RMS
+        of the blocks above the threshold (pre-roll and trailing pause excluded).
+        """
+        cfg = self.config
+        blocks = []
+        pre_roll_blocks = max(1, round(cfg.sample_rate * cfg.non_speaking_duration / cfg.chunk_size))
+        pre_roll = deque(maxlen=pre_roll_blocks)
+        max_frames = int(cfg.sample_rate * cfg.timeout)
+        pause_frames = int(cfg.sample_rate * cfg.pause_threshold)
+        total_frames = 0
+        silent_frames = 0
+        voiced = False
+        voiced_energy = 0.0  # Sum of squared samples over voiced blocks
+        voiced_samples = 0
+        threshold = self._energy_threshold()
+        damping = self.recognizer.dynamic_energy_adjustment_damping ** (cfg.chunk_size / cfg.sample_rate)
+        
+        if self._input_stream is None:
+            return None
+        self._drain_audio_queue()
+        deadline = time.monotonic() + cfg.timeout + 1.0
+        
+        while self.is_listening and total_frames < max_frames:
+            try:
+                block = self._audio_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if not block:
+                break
+            samples = np.frombuffer(block, dtype=np.int16)
+            total_frames += len(samples) // cfg.channels
+            rms = self._rms(samples)
+            
+            if rms >= threshold:
+                if not voiced:
+                    blocks.extend(pre_roll)
+                    voiced = True
+                blocks.append(block)
+                silent_frames = 0
+                voiced_energy += rms * rms * len(samples)
+                voiced_samples += len(samples)
+            elif voiced:
+                blocks.append(block)
+                silent_frames += len(samples) // cfg.channels
+                if silent_frames >= pause_frames:
+                    break
+            else:
+                pre_roll.append(block)
+                if cfg.dynamic_energy_threshold:
+                    self._noise_floor = self._noise_floor * damping + rms * (1 - damping)
+                    threshold = self._energy_threshold()
+        
+        if not voiced:
+            return None
+        return b"".join(blocks), float(np.sqrt(voiced_energy / voiced_samples))
     
     def listen(self) -> Optional[str]:
-        """Listen for voice input and convert to text."""
+        """Listen for voice input and convert to text.
+        
+        Raises sr.RequestError when the recognition service cannot be reached.
+        """
         if not self.is_listening:
             return None
             
         try:
             # Record audio using sounddevice
             self.logger.debug("Starting audio recording...")
-            recording = sd.rec(
-                int(self.config.sample_rate * self.config.timeout),
-                samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                dtype=np.int16,
-                blocking=True
-            )
+            captured = self._record_until_silence()
             
             # Check if we're still listening after recording
-            if not self.is_listening:
-                self.logger.debug("Listening stopped during recording")
+            if captured is None or not self.is_listening:
+                self.logger.debug("No speech captured or listening stopped during recording")
+                return None
+            recording, voiced_rms = captured
+            
+            # Speech barely above the noise floor is rarely recognizable; skip the round-trip
+            if voiced_rms < self._noise_floor * self.config.min_speech_to_noise:
+                self.logger.debug("Utterance too quiet to recognize (voiced RMS %.0f, noise floor %.0f)",
+                                  voiced_rms, self._noise_floor)
                 return None
             
-            # Convert recording to audio data
-            self.logger.debug("Converting recording to audio data...")
-            audio_data = recording.tobytes()
+            if self._asr is not None:
+                self.logger.debug("Starting local speech recognition...")
+                text = self._transcribe_locally(recording)
+                if text and self.is_listening:
+                    self.logger.info("Successfully recognized text: %s", text)
+                    return text.lower()
             
-            # Create an AudioData object
+            # Wrap the PCM bytes; recognize_google encodes them to FLAC itself
             audio = sr.AudioData(
-                audio_data,
+                recording,
                 sample_rate=self.config.sample_rate,
                 sample_width=2  # 16-bit audio
             )
+            rate = self.config.recognition_sample_rate
+            if rate and rate != self.config.sample_rate:
+                audio = sr.AudioData(audio.get_raw_data(convert_rate=rate), rate, 2)
             
             # Recognize speech
             self.logger.debug("Starting speech recognition...")
@@ -180,16 +416,17 @@ class VoiceAssistant:
                 )
                 
                 if text and self.is_listening:
-                    self.logger.info(f"Successfully recognized text: {text}")
+                    self.logger.info("Successfully recognized text: %s", text)
                     return text.lower()
                     
             except sr.UnknownValueError:
                 self.logger.debug("No speech detected")
-            except sr.RequestError as e:
-                self.logger.error(f"Speech recognition service error: {e}")
                 
+        except sr.RequestError:
+            # Service/network failures are left to the caller, which backs off
+            raise
         except Exception as e:
-            self.logger.error(f"Error in speech recognition: {e}\n{traceback.format_exc()}")
+            self.logger.exception("Error in speech recognition: %s", e)
             
         return None
 
@@ -198,71 +435,234 @@ class VoiceAssistant:
         if not text:
             self.logger.warning("Attempted to speak empty text")
             return False
-            
-        temp_file = None
+        return self.speak_stream(_SENTENCE_SPLIT_RE.split(text.strip()))
+    
+    def speak_stream(self, sentences: Iterable[str]) -> bool:
+        """Speak sentences in order, synthesizing each next sentence while the current one plays."""
+        sentences = [sentence for sentence in sentences if sentence]
+        if not sentences:
+            self.logger.warning("Attempted to speak empty text")
+            return False
+        
+        lang = self.config.primary_lang
         try:
-            self.logger.info(f"Converting text to speech: {text}")
+            self.logger.info("Converting text to speech: %s", sentences)
             self.is_speaking = True
             
-            # Generate unique temporary file path
-            temp_file = Path(self.config.temp_audio_file)
-            self.logger.debug(f"Using temporary file: {temp_file}")
-            
-            # Ensure temp directory exists
-            temp_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Generate speech
-            self.logger.debug("Generating speech with gTTS...")
-            tts = gTTS(text=text, lang=self.config.language.split('-')[0], slow=False)
-            
-            # Save with exclusive access
-            with open(temp_file, 'wb') as f:
-                tts.write_to_fp(f)
-            self.logger.debug("Speech generated and saved successfully")
-            
-            # Play audio
-            self.logger.debug("Loading audio file for playback...")
-            pygame.mixer.music.load(str(temp_file))
-            pygame.mixer.music.play()
-            self.logger.debug("Audio playback started")
-            
-            # Wait for playback to finish or until stopped
-            while pygame.mixer.music.get_busy() and self.is_speaking:
-                pygame.time.Clock().tick(10)
+            pending = self._tts_executor.submit(self._prepare_speech, sentences[0], lang)
+            for index in range(len(sentences)):
+                audio_file, sound = pending.result()
+                if index + 1 < len(sentences):
+                    pending = self._tts_executor.submit(self._prepare_speech, sentences[index + 1], lang)
+                if not self.is_speaking:
+                    self.logger.debug("Speech stopped before all sentences were played")
+                    break
+                self._play_speech(audio_file, sound)
             
             self.logger.debug("Audio playback completed")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error in text-to-speech: {e}\n{traceback.format_exc()}")
+            self.logger.exception("Error in text-to-speech: %s", e)
             return False
             
         finally:
             self.is_speaking = False
-            self._cleanup_audio_file(temp_file)
     
-    def _cleanup_audio_file(self, file_path: Optional[Path]):
-        """Clean up temporary audio file."""
-        if file_path and file_path.exists():
+    def _prepare_speech(self, text: str, lang: str) -> Tuple[Path, Optional[pygame.mixer.Sound]]:
+        """Return the speech file for text and, for short files, its decoded Sound."""
+        with self._tts_lock:
+            audio_file, data = self._get_speech_file(text, lang)
+            return audio_file, self._get_sound(audio_file, data)
+    
+    def _play_speech(self, audio_file: Path, sound: Optional[pygame.mixer.Sound]):
+        """Play one speech file and block until it finishes or speaking is stopped."""
+        music_loaded = False
+        try:
+            if self._music_end_event is not None:
+                pygame.event.clear(self._music_end_event)
+            if sound is not None:
+                self._speech_channel.play(sound)
+                is_busy = self._speech_channel.get_busy
+            else:
+                self.logger.debug("Loading audio file for playback...")
+                pygame.mixer.music.load(str(audio_file))
+                music_loaded = True
+                pygame.mixer.music.play()
+                is_busy = pygame.mixer.music.get_busy
+            self.logger.debug("Audio playback started")
+            
+            # Wait for playback to finish or until stopped
+            self._wait_for_playback(is_busy)
+        finally:
+            if music_loaded:
+                self._unload_audio()
+    
+    def prewarm(self, phrases: Iterable[str]):
+        """Synthesize and decode fixed phrases in the background so their first use is instant."""
+        sentences = [sentence for phrase in phrases for sentence in _SENTENCE_SPLIT_RE.split(phrase.strip()) if sentence]
+        threading.Thread(target=self._prewarm_worker, args=(sentences,), name="tts-prewarm", daemon=True).start()
+    
+    def _prewarm_worker(self, sentences):
+        lang = self.config.primary_lang
+        for text in sentences:
             try:
-                self.logger.debug(f"Cleaning up temporary file: {file_path}")
-                pygame.mixer.music.unload()
-                # Retry a few times if file is locked
-                for _ in range(3):
-                    try:
-                        file_path.unlink()
-                        break
-                    except PermissionError:
-                        time.sleep(0.1)
-                self.logger.debug("Temporary file cleaned up successfully")
+                self._prepare_speech(text, lang)
             except Exception as e:
-                self.logger.error(f"Error cleaning up audio file: {e}\n{traceback.format_exc()}")
-
+                self.logger.debug("Could not prewarm speech for %r: %s", text, e)
+        self.logger.debug("Prewarmed %d speech phrases", len(sentences))
+    
+    def _get_sound(self, audio_file: Path, data: Optional[bytes] = None) -> Optional[pygame.mixer.Sound]:
+        """Return a decoded Sound for short speech files, or None to stream via music.
+        
+        data, when given, holds the file's mp3 bytes and is decoded from memory.
+        The first decode of an mp3 also stores its PCM as a .wav next to it, so
+        later runs load the wav instead of decoding the mp3 again.
+        """
+        key = str(audio_file)
+        sound = self._sound_cache.get(key)
+        if sound is not None:
+            self._sound_cache.move_to_end(key)
+            return sound
+        
+        wav_file = audio_file.with_suffix('.wav')
+        try:
+            if data is None and wav_file.exists():
+                sound = pygame.mixer.Sound(str(wav_file))
+            else:
+                size = len(data) if data is not None else audio_file.stat().st_size
+                if size > self.config.sound_cache_max_file_size:
+                    return None
+                sound = pygame.mixer.Sound(file=io.BytesIO(data)) if data is not None else pygame.mixer.Sound(key)
+                self._write_wav(wav_file, sound)
+        except pygame.error as e:
+            self.logger.debug("Could not decode %s as a Sound: %s", audio_file, e)
+            return None
+        
+        self._sound_cache[key] = sound
+        if len(self._sound_cache) > self.config.sound_cache_size:
+            self._sound_cache.popitem(last=False)
+        return sound
+    
+    def _write_wav(self, wav_file: Path, sound: pygame.mixer.Sound):
+        """Store a decoded Sound's PCM as a wav file; skipped unless the mixer runs signed 16-bit."""
+        mixer_init = pygame.mixer.get_init()
+        if not mixer_init or mixer_init[1] != -16:
+            return
+        frequency, _, channels = mixer_init
+        partial_file = wav_file.with_name(wav_file.name + '.part')
+        try:
+            with wave.open(str(partial_file), 'wb') as wav:
+                wav.setnchannels(channels)
+                wav.setsampwidth(2)
+                wav.setframerate(frequency)
+                wav.writeframes(sound.get_raw())
+            os.replace(partial_file, wav_file)
+        except (OSError, wave.Error) as e:
+            self.logger.debug("Could not store decoded speech %s: %s", wav_file, e)
+            try:
+                partial_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+    
+    def _wait_for_playback(self, is_busy):
+        """Block until playback ends (is_busy() turns False) or speaking is stopped."""
+        if self._music_end_event is None:
+            clock = pygame.time.Clock()
+            while is_busy() and self.is_speaking:
+                clock.tick(20)
+            return
+        
+        while self.is_speaking:
+            # Sleeps in SDL until an event arrives or the timeout (ms) passes
+            event = pygame.event.wait(100)
+            if event.type == self._music_end_event or not is_busy():
+                break
+    
+    def _get_speech_file(self, text: str, lang: str, slow: bool = False) -> Tuple[Path, Optional[bytes]]:
+        """Return the cached mp3 for (text, lang, slow), generating it with gTTS on a miss.
+        
+        On a miss the freshly synthesized mp3 bytes are returned as well, so
+        the caller can decode them without reading the file back.
+        """
+        cache_dir = Path(self.config.tts_cache_dir)
+        key = hashlib.blake2b(f"{lang}\0{slow:d}\0{text}".encode('utf-8'), digest_size=16).hexdigest()
+        audio_file = cache_dir / f"{key}.mp3"
+        
+        try:
+            os.utime(audio_file)  # Mark as recently used for eviction; fails on a miss
+            self.logger.debug("Using cached speech file: %s", audio_file)
+            return audio_file, None
+        except FileNotFoundError:
+            pass
+        
+        # Synthesize in memory, then publish the file atomically
+        self.logger.debug("Generating speech with gTTS...")
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang, slow=slow).write_to_fp(buffer)
+        data = buffer.getvalue()
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        partial_file = audio_file.with_suffix('.part')
+        try:
+            partial_file.write_bytes(data)
+            os.replace(partial_file, audio_file)
+        except OSError:
+            partial_file.unlink(missing_ok=True)
+            raise
+        self.logger.debug("Speech generated and cached successfully")
+        
+        self._evict_speech_cache(cache_dir, keep=audio_file)
+        return audio_file, data
+    
+    def _evict_speech_cache(self, cache_dir: Path, keep: Path):
+        """Delete least recently used speech files while the cache exceeds its size limit.
+        
+        An mp3 and its decoded wav are evicted together, aged by the mp3's mtime.
+        """
+        try:
+            groups = {}  # file stem -> [mtime, total size, paths]
+            total_size = 0
+            for entry in os.scandir(cache_dir):
+                stem, ext = os.path.splitext(entry.name)
+                if ext not in ('.mp3', '.wav') or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                group = groups.setdefault(stem, [0.0, 0, []])
+                if ext == '.mp3':
+                    group[0] = stat.st_mtime
+                group[1] += stat.st_size
+                group[2].append(entry.path)
+                total_size += stat.st_size
+            
+            if total_size <= self.config.tts_cache_limit:
+                return
+            
+            for stem, (_, size, paths) in sorted(groups.items(), key=lambda item: item[1][0]):
+                if total_size <= self.config.tts_cache_limit:
+                    break
+                if stem == keep.stem:
+                    continue
+                for path in paths:
+                    os.remove(path)
+                total_size -= size
+        except Exception as e:
+            self.logger.warning(f"Error evicting speech cache: {e}")
+    
+    def _unload_audio(self):
+        """Release the played file so it can be replaced or evicted."""
+        try:
+            pygame.mixer.music.unload()
+        except Exception as e:
+            self.logger.debug("Error unloading audio: %s", e)
+    
     def __del__(self):
         """Cleanup when object is destroyed."""
         try:
             self.logger.debug("Cleaning up voice assistant resources...")
+            self._close_input_stream()
+            self._tts_executor.shutdown(wait=False)
             pygame.mixer.quit()
             self.logger.debug("Voice assistant cleanup completed")
         except Exception as e:
-            self.logger.error(f"Error during voice assistant cleanup: {e}\n{traceback.format_exc()}") 
\ No newline at end of file
+            self.logger.exception("Error during voice assistant cleanup: %s", e) 
\ No newline at end of file
@@ -2,15 +2,19 @@
 Main entry point for the Lazzaran Voice Assistant application.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 import asyncio
 import threading
 from pathlib import Path
-import traceback
-from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from core.voice_assistant import VoiceAssistant, VoiceAssistantConfig
-from core.command_handler import CommandHandler
+from core.command_handler import CommandHandler, COMMON_RESPONSES
 from core.services.weather import WeatherService
 from core.services.news import NewsService
 from core.services.ai_service import AIService
@@ -19,53 +23,108 @@ from ui.display import VoiceAssistantUI
 from config.settings import ConfigManager
 from dotenv import load_dotenv
 import os
+import speech_recognition as sr
 
-# Setup logging with detailed configuration
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('lazzaran_detailed.log', encoding='utf-8', mode='w'),
-    ]
-)
+try:
+    # Optional libuv-based event loop; winloop is the Windows port of uvloop
+    if sys.platform == 'win32':
+        import winloop as _fast_loop
+    else:
+        import uvloop as _fast_loop
+except ImportError:
+    _fast_loop = None
+
+# Load .env first so it can also set the log level
+load_dotenv()
+
+# Setup logging with detailed configuration; LAZZARAN_LOG_LEVEL=DEBUG restores verbose logs
+_LOG_LEVEL = getattr(logging, os.getenv("LAZZARAN_LOG_LEVEL", "INFO").upper(), logging.INFO)
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that flushes on ERROR records or at most once per flush_interval seconds"""
+    
+    def __init__(self, filename, mode='a', encoding=None, flush_interval=1.0, buffer_size=64 * 1024):
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._force_flush = True
+        super().__init__(filename, mode=mode, encoding=encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self._buffer_size, encoding=self.encoding)
+    
+    def emit(self, record):
+        # StreamHandler.emit calls flush() after every write; decide here whether it really flushes
+        self._force_flush = (record.levelno >= logging.ERROR
+                             or time.monotonic() - self._last_flush >= self._flush_interval)
+        super().emit(record)
+    
+    def flush(self):
+        if self._force_flush:
+            super().flush()
+            self._last_flush = time.monotonic()
+    
+    def close(self):
+        self._force_flush = True
+        super().close()
 
 # Add error-specific file handler
 error_handler = logging.FileHandler('lazzaran_errors.log', encoding='utf-8', mode='w')
 error_handler.setLevel(logging.ERROR)
-error_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'))
-logging.getLogger().addHandler(error_handler)
+
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    BufferedFileHandler('lazzaran_detailed.log', encoding='utf-8', mode='w'),
+    error_handler,
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+
+# Callers only enqueue records; a background listener does the console and file I/O
+_log_queue = queue.SimpleQueue()
+# The queue side keeps the bare message (plus traceback); the listener's handlers apply _LOG_FORMAT
+logging.basicConfig(level=_LOG_LEVEL, format='%(message)s', handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
+# Exponential backoff (seconds) while the speech recognition service is unreachable
+_RECOGNITION_BACKOFF_START = 1.0
+_RECOGNITION_BACKOFF_MAX = 30.0
+
 class LazzaranApp:
     def __init__(self):
         try:
             logger.info("Initializing Lazzaran Voice Assistant...")
             
-            # Load environment variables
-            load_dotenv()
-            logger.debug("Environment variables loaded")
-            
             # Initialize configuration
             self.config = ConfigManager()
             logger.debug("Configuration manager initialized")
             
+            # Shared pool for all blocking work (startup, listen, speak, cleanup)
+            self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lazzaran")
+            logger.debug("Thread pool executor initialized")
+            
             # Initialize components
             self.setup_components()
             
-            # Initialize thread pool
-            self.executor = ThreadPoolExecutor(max_workers=3)
-            logger.debug("Thread pool executor initialized")
+            # One event loop for the lifetime of the app; listen sessions are submitted to it
+            self._loop = _fast_loop.new_event_loop() if _fast_loop else asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self.run_async_loop, name="asyncio", daemon=True)
+            self._loop_thread.start()
+            logger.debug("Async event loop started")
             
             # Initialize state variables
             self.running = True
-            self.listen_thread = None
+            self._listen_future = None
             
             logger.info("Lazzaran Voice Assistant initialized successfully")
             
         except Exception as e:
-            logger.critical(f"Fatal error during initialization: {e}\n{traceback.format_exc()}")
+            logger.critical("Fatal error during initialization: %s", e, exc_info=True)
             raise
         
     def setup_components(self):
@@ -78,27 +137,35 @@ class LazzaranApp:
                 language=self.config.voice_settings.language,
                 timeout=self.config.voice_settings.timeout,
                 ambient_duration=self.config.voice_settings.ambient_duration,
-                temp_audio_file=str(self.config.temp_directory / "response.mp3")
+                local_asr=self.config.voice_settings.local_asr,
+                local_asr_model=self.config.voice_settings.local_asr_model,
+                tts_cache_dir=str(self.config.temp_directory / "tts")
             )
-            self.voice_assistant = VoiceAssistant(config=voice_config)
-            logger.debug("Voice assistant initialized")
             
-            # Initialize services
-            self.weather_service = WeatherService(
+            # Initialize the independent API services in parallel with the audio setup
+            weather_future = self.executor.submit(
+                WeatherService,
                 api_key=self.config.api_keys.weather_api_key,
-                language=self.config.voice_settings.language.split('-')[0]
+                language=voice_config.primary_lang
             )
-            logger.debug("Weather service initialized")
-            
-            self.news_service = NewsService(
+            news_future = self.executor.submit(
+                NewsService,
                 api_key=self.config.api_keys.news_api_key,
-                language=self.config.voice_settings.language.split('-')[0]
+                language=voice_config.primary_lang
             )
-            logger.debug("News service initialized")
-            
-            self.ai_service = AIService(
+            ai_future = self.executor.submit(
+                AIService,
                 api_key=self.config.api_keys.gemini_api_key
             )
+            
+            self.voice_assistant = VoiceAssistant(config=voice_config)
+            logger.debug("Voice assistant initialized")
+            
+            self.weather_service = weather_future.result()
+            logger.debug("Weather service initialized")
+            self.news_service = news_future.result()
+            logger.debug("News service initialized")
+            self.ai_service = ai_future.result()
             logger.debug("AI service initialized")
             
             self.system_service = SystemService(voice_assistant=self.voice_assistant)
@@ -113,6 +180,9 @@ class LazzaranApp:
             )
             logger.debug("Command handler initialized")
             
+            # Synthesize frequent replies in the background
+            self.voice_assistant.prewarm(COMMON_RESPONSES)
+            
             # Initialize UI with system service
             self.ui = VoiceAssistantUI(
                 system_service=self.system_service,
@@ -124,7 +194,7 @@ class LazzaranApp:
             logger.info("All components initialized successfully")
             
         except Exception as e:
-            logger.critical(f"Component initialization failed: {e}\n{traceback.format_exc()}")
+            logger.critical("Component initialization failed: %s", e, exc_info=True)
             raise
         
     async def process_voice_command(self, text: str):
@@ -133,78 +203,80 @@ class LazzaranApp:
             return
             
         try:
-            logger.info(f"Processing voice command: {text}")
+            logger.info("Processing voice command: %s", text)
             response = await self.command_handler.process_command(text)
             
             if response:
-                logger.debug(f"Command response: {response}")
+                logger.debug("Command response: %s", response)
                 self.ui.log_message(f"Lazzaran: {response}", "success")
                 await self.speak_response(response)
                 
-                # Refresh application list
-                self.ui.refresh_app_list()
-                logger.debug("Application list refreshed")
+                # Refresh the application list only when a command launched an app
+                if self.command_handler.apps_changed:
+                    apps = await asyncio.get_running_loop().run_in_executor(
+                        self.executor, self.system_service.get_available_applications
+                    )
+                    self.ui.root.after(0, self.ui.refresh_app_list, apps)
+                    logger.debug("Application list refresh scheduled")
                 
         except Exception as e:
             error_msg = f"Komut işlenirken hata oluştu: {str(e)}"
-            logger.error(f"Command processing error: {e}\n{traceback.format_exc()}")
+            logger.exception("Command processing error: %s", e)
             self.ui.log_message(error_msg, "error")
             await self.speak_response("Üzgünüm, bir hata oluştu. Lütfen tekrar deneyin.")
     
     async def speak_response(self, text: str):
         """Speak the response asynchronously"""
         try:
-            logger.debug(f"Speaking response: {text}")
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(self.executor, self.voice_assistant.speak, text)
+            logger.debug("Speaking response: %s", text)
+            await asyncio.get_running_loop().run_in_executor(self.executor, self.voice_assistant.speak, text)
             logger.debug("Response spoken successfully")
         except Exception as e:
-            logger.error(f"Speech output error: {e}\n{traceback.format_exc()}")
+            logger.exception("Speech output error: %s", e)
             self.ui.log_message("Ses çıkışı sırasında bir hata oluştu", "error")
     
     async def listen_loop(self):
         """Main listening loop"""
         logger.debug("Starting listen loop")
+        backoff = _RECOGNITION_BACKOFF_START
         while self.running and self.ui.is_listening:
             try:
-                # Check if we should be listening
-                if not self.ui.is_listening:
-                    logger.debug("Listening is disabled, waiting...")
-                    await asyncio.sleep(0.1)
+                # listen() blocks in the executor until an utterance ends or listening stops
+                try:
+                    text = await asyncio.get_running_loop().run_in_executor(self.executor, self.voice_assistant.listen)
+                except sr.RequestError as e:
+                    logger.warning("Speech recognition service error, retrying in %.0fs: %s", backoff, e)
+                    self.ui.log_message("Ses tanıma servisine ulaşılamıyor. Yeniden denenecek...", "error")
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, _RECOGNITION_BACKOFF_MAX)
                     continue
-
-                # Try to get voice input
-                text = self.voice_assistant.listen()
+                backoff = _RECOGNITION_BACKOFF_START
+                
                 if text:
                     self.ui.log_message(f"Siz: {text}", "info")
                     await self.process_voice_command(text)
-                else:
-                    await asyncio.sleep(0.1)  # Prevent busy waiting
                     
             except Exception as e:
-                logger.error(f"Voice recognition error: {e}\n{traceback.format_exc()}")
+                logger.exception("Voice recognition error: %s", e)
                 self.ui.log_message("Ses tanıma sırasında bir hata oluştu. Yeniden başlatılıyor...", "error")
                 await asyncio.sleep(1)  # Prevent rapid retries
 
         logger.debug("Listen loop ended")
 
     def run_async_loop(self):
-        """Run the async event loop in a separate thread"""
+        """Run the persistent async event loop in a separate thread"""
         try:
             logger.debug("Starting async event loop")
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Run the listen loop
-            loop.run_until_complete(self.listen_loop())
-            loop.close()
-            logger.debug("Async event loop closed")
-            
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_forever()
         except Exception as e:
-            logger.error(f"Error in async loop: {e}\n{traceback.format_exc()}")
+            logger.exception("Error in async loop: %s", e)
+        finally:
+            self._loop.close()
+            logger.debug("Async event loop closed")
     
     def start_listening(self):
-        """Start the voice recognition loop in a separate thread"""
+        """Start the voice recognition loop on the background event loop"""
         try:
             logger.info("Starting voice recognition")
             self.ui.log_message("Ses tanıma başlatılıyor...", "info")
@@ -213,14 +285,13 @@ class LazzaranApp:
             self.running = True
             self.voice_assistant.start_listening()
             
-            # Start voice recognition in a separate thread
-            if not self.listen_thread or not self.listen_thread.is_alive():
-                self.listen_thread = threading.Thread(target=self.run_async_loop, daemon=True)
-                self.listen_thread.start()
-                logger.debug("Voice recognition thread started")
+            # Submit the listen loop to the running event loop
+            if self._listen_future is None or self._listen_future.done():
+                self._listen_future = asyncio.run_coroutine_threadsafe(self.listen_loop(), self._loop)
+                logger.debug("Voice recognition loop submitted")
             
         except Exception as e:
-            logger.error(f"Error starting voice recognition: {e}\n{traceback.format_exc()}")
+            logger.exception("Error starting voice recognition: %s", e)
             self.ui.log_message("Ses tanıma başlatılamadı", "error")
     
     def stop_listening(self):
@@ -233,17 +304,18 @@ class LazzaranApp:
             self.voice_assistant.stop_listening()
             self.ui.log_message("Ses tanıma durduruluyor...", "warning")
             
-            # Wait for thread to finish if it exists
-            if self.listen_thread and self.listen_thread.is_alive():
-                logger.debug("Waiting for voice recognition thread to finish")
-                self.listen_thread.join(timeout=2.0)
-                if self.listen_thread.is_alive():
-                    logger.warning("Voice recognition thread did not finish in time")
+            # Wait for the listen loop to finish if it is running
+            if self._listen_future is not None and not self._listen_future.done():
+                logger.debug("Waiting for voice recognition loop to finish")
+                try:
+                    self._listen_future.result(timeout=2.0)
+                except FutureTimeoutError:
+                    logger.warning("Voice recognition loop did not finish in time")
                 
             logger.debug("Voice recognition stopped successfully")
             
         except Exception as e:
-            logger.error(f"Error stopping voice recognition: {e}\n{traceback.format_exc()}")
+            logger.exception("Error stopping voice recognition: %s", e)
             
     def run(self):
         """Start the application"""
@@ -252,11 +324,20 @@ class LazzaranApp:
             self.ui.log_message("Lazzaran Sesli Asistan'a hoş geldiniz!", "success")
             self.ui.run()
         except Exception as e:
-            logger.error(f"Application error: {e}\n{traceback.format_exc()}")
+            logger.exception("Application error: %s", e)
             self.ui.log_message(f"Kritik hata: {str(e)}", "error")
         finally:
             self.cleanup()
     
+    @staticmethod
+    def _delete_temp_file(file: Path) -> Optional[str]:
+        """Delete one temp file; returns an error description instead of raising"""
+        try:
+            file.unlink(missing_ok=True)
+            return None
+        except OSError as e:
+            return f"{file}: {e}"
+    
     def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up resources")
@@ -265,37 +346,46 @@ class LazzaranApp:
             if self.running:
                 self.stop_listening()
             
-            # Save conversation history
+            # Save conversation history in the background while leftover files are deleted
             conversation_file = self.config.temp_directory / "last_conversation.json"
-            self.ai_service.save_conversation(str(conversation_file))
-            logger.debug("Conversation history saved")
+            save_future = self.executor.submit(self.ai_service.save_conversation, str(conversation_file))
             
-            # Cleanup temporary files
-            for file in self.config.temp_directory.glob("*.mp3"):
-                try:
-                    if file.exists():
-                        file.unlink()
-                        logger.debug(f"Deleted temporary file: {file}")
-                except Exception as e:
-                    logger.warning(f"Error deleting temp file {file}: {e}")
+            # Remove partial TTS cache writes left by interrupted syntheses
+            tts_cache_dir = Path(self.voice_assistant.config.tts_cache_dir)
+            errors = [error for error in self.executor.map(self._delete_temp_file, tts_cache_dir.glob("*.part")) if error]
+            if errors:
+                logger.warning("Could not delete %d temp file(s): %s", len(errors), '; '.join(errors))
+            
+            try:
+                if save_future.result(timeout=5.0):
+                    logger.debug("Conversation history saved")
+            except FutureTimeoutError:
+                logger.warning("Saving conversation history did not finish in time")
             
             # Stop music if playing
             self.system_service.stop_music()
             logger.debug("Music playback stopped")
             
-            # Shutdown thread pool
+            # Close pooled HTTP connections and the news fetch workers
+            self.news_service.close()
+            self.weather_service.close()
+            logger.debug("Network services closed")
+            
+            # Stop the event loop, then shut down the thread pool
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=2.0)
             self.executor.shutdown(wait=True)
-            logger.debug("Thread pool executor shut down")
+            logger.debug("Event loop and thread pool executor shut down")
             
             logger.info("Cleanup completed successfully")
             
         except Exception as e:
-            logger.error(f"Cleanup error: {e}\n{traceback.format_exc()}")
+            logger.exception("Cleanup error: %s", e)
 
 if __name__ == "__main__":
     try:
         app = LazzaranApp()
         app.run()
     except Exception as e:
-        logger.critical(f"Fatal error: {e}\n{traceback.format_exc()}")
+        logger.critical("Fatal error: %s", e, exc_info=True)
         sys.exit(1) 
\ No newline at end of file
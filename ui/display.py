@@ -5,16 +5,58 @@ Modern UI component for the voice assistant using tkinter.
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import queue
 from typing import Callable, Optional
-from datetime import datetime
+import time
 import json
 from pathlib import Path
 from core.services.system_service import SystemService, ApplicationInfo
 import logging
-import traceback
 
 logger = logging.getLogger(__name__)
 
+# Console log flush interval in milliseconds
+LOG_FLUSH_INTERVAL_MS = 50
+
+# Maximum queued log lines written to the console per flush
+LOG_FLUSH_BATCH = 200
+
+# Application list refreshes requested within this window collapse into one
+APP_REFRESH_DEBOUNCE_MS = 150
+
+# Reset loading screen size in pixels
+LOADING_WINDOW_WIDTH = 400
+LOADING_WINDOW_HEIGHT = 200
+
+# Oldest console lines are dropped beyond this many
+CONSOLE_MAX_LINES = 2000
+
+# Fonts and colors shared by the main window, loading screen and dialogs
+FONT_LABEL = ('Segoe UI', 12)
+FONT_HEADING = ('Segoe UI', 14, 'bold')
+FONT_BOLD = ('Segoe UI', 10, 'bold')
+FONT_BOLD_LARGE = ('Segoe UI', 11, 'bold')
+FONT_CONSOLE = ('Consolas', 11)
+COLOR_BG = '#2b2b2b'
+COLOR_PANEL = '#1e1e1e'
+COLOR_TEXT = '#ffffff'
+COLOR_ACCENT = '#007acc'
+
+# Console text colors per log level; the tags are configured once in setup_ui
+LOG_COLORS = {
+    "info": "#ffffff",
+    "success": "#28a745",
+    "warning": "#ffc107",
+    "error": "#dc3545",
+}
+
+# Tcl lambda that inserts (values, exe_name) row pairs into a Treeview in one call
+# and returns the new item ids
+_TREE_INSERT_ROWS = (
+    "{tree rows} {set ids {}; foreach {values exe} $rows "
+    "{lappend ids [$tree insert {} end -values $values -tags [list $exe]]}; return $ids}"
+)
+
 class VoiceAssistantUI:
     def __init__(self, system_service: SystemService, on_start: Callable = None, on_stop: Callable = None):
         try:
@@ -44,6 +86,12 @@ class VoiceAssistantUI:
             # Yükleme ekranı için değişkenler
             self.loading_window = None
             self.loading_canvas = None
+            
+            # Açık onay penceresi (_ask_async)
+            self._confirm_dialog = None
+            
+            # Reset thread'i çalışırken True; ikinci bir reset başlatılmaz
+            self._reset_running = False
             self.loading_progress = 0
             self.loading_text = ""
             self.loading_steps = [
@@ -57,47 +105,132 @@ class VoiceAssistantUI:
             # Uygulama kapatma işlevi için protokol ekle
             self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
             
+            # Log mesajları kuyruğu; konsola toplu olarak yazılır
+            self._log_queue = queue.SimpleQueue()
+            self._last_timestamp = (0, "")  # (epoch second, "%H:%M:%S") of the last log line
+            self._last_time_str = ""  # Saat etiketinde gösterilen son değer
+            
+            # exe_name -> (Treeview item id, gösterilen değerler); sadece değişen satırlar güncellenir
+            self._app_row_by_exe = {}
+            
+            # Bekleyen (debounce edilmiş) liste yenilemesi
+            self._refresh_pending_id = None
+            self._refresh_pending_apps = None
+            
+            # Her yenilemeye artan bir sıra numarası verilir; eski tarama sonuçları uygulanmaz
+            self._app_list_seq = 0
+            self._app_list_applied_seq = 0
+            
             self.setup_ui()
             
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_logs)
+            
             logger.info("Voice assistant UI initialized successfully")
             
         except Exception as e:
-            logger.critical(f"UI initialization failed: {e}\n{traceback.format_exc()}")
+            logger.critical("UI initialization failed: %s", e, exc_info=True)
             raise
         
     def setup_theme(self):
         """Setup dark theme for the application"""
-        self.root.configure(bg='#2b2b2b')
-        style = ttk.Style()
-        style.theme_use('clam')
+        self.root.configure(bg=COLOR_BG)
+        self.style = ttk.Style(self.root)
+        self.style.theme_use('clam')
         
         # Configure colors
-        style.configure('.',
-            background='#2b2b2b',
-            foreground='#ffffff',
+        self.style.configure('.',
+            background=COLOR_BG,
+            foreground=COLOR_TEXT,
             fieldbackground='#3b3b3b')
         
-        style.configure('TButton',
+        self.style.configure('TButton',
             background='#404040',
-            foreground='#ffffff',
+            foreground=COLOR_TEXT,
             padding=5)
             
-        style.map('TButton',
+        self.style.map('TButton',
             background=[('active', '#505050')])
             
         # Treeview stilleri
-        style.configure("Treeview",
-            background="#1e1e1e",
-            foreground="#ffffff",
-            fieldbackground="#1e1e1e")
+        self.style.configure("Treeview",
+            background=COLOR_PANEL,
+            foreground=COLOR_TEXT,
+            fieldbackground=COLOR_PANEL)
         
-        style.configure("Treeview.Heading",
+        self.style.configure("Treeview.Heading",
             background="#404040",
-            foreground="#ffffff")
+            foreground=COLOR_TEXT)
             
-        style.map("Treeview",
+        self.style.map("Treeview",
             background=[('selected', '#404040')],
-            foreground=[('selected', '#ffffff')])
+            foreground=[('selected', COLOR_TEXT)])
+        
+        # Yükleme ekranı ilerleme çubuğu
+        self.style.configure("Loading.Horizontal.TProgressbar",
+            troughcolor='#333333',
+            background=COLOR_ACCENT,
+            bordercolor='#333333',
+            lightcolor=COLOR_ACCENT,
+            darkcolor=COLOR_ACCENT)
+        
+        self._configure_styles()
+    
+    def _configure_styles(self):
+        """Özel buton stillerini widget'lar oluşturulmadan önce tek seferde tanımla"""
+        # Dinleme başlat/durdur butonları
+        self.style.configure("Start.TButton",
+            background='#28a745',
+            foreground='white',
+            padding=8,
+            font=FONT_BOLD
+        )
+        
+        self.style.configure("Stop.TButton",
+            background='#dc3545',
+            foreground='white',
+            padding=8,
+            font=FONT_BOLD
+        )
+        
+        # Konuşmayı durdur butonu
+        self.style.configure("StopSpeech.TButton",
+            background='#ffc107',
+            foreground='black',
+            padding=8,
+            font=FONT_BOLD
+        )
+        
+        # Reset butonu
+        self.style.configure("Reset.TButton",
+            background='#ffd700',
+            foreground='black',
+            padding=8,
+            font=FONT_BOLD
+        )
+        
+        # Uygulama başlat butonu - Yeşil ve büyük
+        self.style.configure("LaunchApp.TButton",
+            background='#28a745',
+            foreground='white',
+            padding=10,
+            font=FONT_BOLD_LARGE
+        )
+        
+        # Uygulama kapat butonu - Kırmızı ve büyük
+        self.style.configure("TerminateApp.TButton",
+            background='#dc3545',
+            foreground='white',
+            padding=10,
+            font=FONT_BOLD_LARGE
+        )
+        
+        # Kapatma butonu
+        self.style.configure("Exit.TButton",
+            background='#dc3545',
+            foreground='white',
+            padding=10,
+            font=FONT_BOLD
+        )
             
     def setup_ui(self):
         """Setup the main UI components"""
@@ -116,14 +249,14 @@ class VoiceAssistantUI:
         self.status_label = ttk.Label(
             status_frame,
             text="Ready",
-            font=('Segoe UI', 12)
+            font=FONT_LABEL
         )
         self.status_label.pack(side=tk.LEFT)
         
         self.time_label = ttk.Label(
             status_frame,
             text="",
-            font=('Segoe UI', 12)
+            font=FONT_LABEL
         )
         self.time_label.pack(side=tk.RIGHT)
         
@@ -133,32 +266,18 @@ class VoiceAssistantUI:
             wrap=tk.WORD,
             width=40,
             height=10,
-            bg='#1e1e1e',
-            fg='#ffffff',
-            font=('Consolas', 11)
+            bg=COLOR_PANEL,
+            fg=COLOR_TEXT,
+            font=FONT_CONSOLE
         )
         self.console.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        for level, color in LOG_COLORS.items():
+            self.console.tag_configure(level, foreground=color)
         
         # Control buttons frame
         button_frame = ttk.Frame(left_frame)
         button_frame.pack(fill=tk.X)
         
-        # Özel buton stilleri
-        style = ttk.Style()
-        style.configure("Start.TButton",
-            background='#28a745',
-            foreground='white',
-            padding=8,
-            font=('Segoe UI', 10, 'bold')
-        )
-        
-        style.configure("Stop.TButton",
-            background='#dc3545',
-            foreground='white',
-            padding=8,
-            font=('Segoe UI', 10, 'bold')
-        )
-        
         # Dinleme başlat/durdur butonu
         self.start_button = ttk.Button(
             button_frame,
@@ -169,13 +288,6 @@ class VoiceAssistantUI:
         self.start_button.pack(side=tk.LEFT, padx=5)
         
         # Konuşmayı durdur butonu
-        style.configure("StopSpeech.TButton",
-            background='#ffc107',
-            foreground='black',
-            padding=8,
-            font=('Segoe UI', 10, 'bold')
-        )
-        
         self.stop_speech_button = ttk.Button(
             button_frame,
             text="Konuşmayı Durdur",
@@ -185,13 +297,6 @@ class VoiceAssistantUI:
         self.stop_speech_button.pack(side=tk.LEFT, padx=5)
         
         # Reset butonu
-        style.configure("Reset.TButton",
-            background='#ffd700',
-            foreground='black',
-            padding=8,
-            font=('Segoe UI', 10, 'bold')
-        )
-        
         ttk.Button(
             button_frame,
             text="Asistanı Resetle",
@@ -216,7 +321,7 @@ class VoiceAssistantUI:
         ttk.Label(
             app_header_frame,
             text="Uygulamalar",
-            font=('Segoe UI', 14, 'bold')
+            font=FONT_HEADING
         ).pack(side=tk.LEFT)
         
         ttk.Button(
@@ -230,13 +335,6 @@ class VoiceAssistantUI:
         app_control_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Başlat butonu - Yeşil ve büyük
-        style.configure("LaunchApp.TButton",
-            background='#28a745',
-            foreground='white',
-            padding=10,
-            font=('Segoe UI', 11, 'bold')
-        )
-        
         ttk.Button(
             app_control_frame,
             text="Uygulamayı Başlat",
@@ -245,13 +343,6 @@ class VoiceAssistantUI:
         ).pack(side=tk.LEFT, padx=5)
         
         # Kapat butonu - Kırmızı ve büyük
-        style.configure("TerminateApp.TButton",
-            background='#dc3545',
-            foreground='white',
-            padding=10,
-            font=('Segoe UI', 11, 'bold')
-        )
-        
         ttk.Button(
             app_control_frame,
             text="Uygulamayı Kapat",
@@ -294,14 +385,6 @@ class VoiceAssistantUI:
         bottom_frame = ttk.Frame(self.root)
         bottom_frame.pack(fill=tk.X, padx=20, pady=10)
         
-        # Özel stil tanımla
-        style.configure("Exit.TButton",
-            background='#dc3545',
-            foreground='white',
-            padding=10,
-            font=('Segoe UI', 10, 'bold')
-        )
-        
         exit_button = ttk.Button(
             bottom_frame,
             text="Asistanı Kapat",
@@ -310,66 +393,112 @@ class VoiceAssistantUI:
         )
         exit_button.pack(side=tk.RIGHT)
     
-    def refresh_app_list(self):
-        """Uygulama listesini yenile"""
+    def refresh_app_list(self, apps=None):
+        """Uygulama listesini yenile; APP_REFRESH_DEBOUNCE_MS içindeki çağrılar tek yenilemede birleşir"""
+        if self._refresh_pending_id is not None:
+            self.root.after_cancel(self._refresh_pending_id)
+        self._refresh_pending_apps = apps
+        self._refresh_pending_id = self.root.after(APP_REFRESH_DEBOUNCE_MS, self._do_refresh_app_list)
+    
+    def _do_refresh_app_list(self):
+        """Bekleyen yenilemeyi uygula; liste verilmemişse servisten arka planda alınır"""
+        apps = self._refresh_pending_apps
+        self._refresh_pending_id = None
+        self._refresh_pending_apps = None
+        self._app_list_seq += 1
+        if apps is None:
+            threading.Thread(target=self._scan_apps_worker, args=(self._app_list_seq,),
+                             name="app-list", daemon=True).start()
+        else:
+            self._apply_app_list(apps, self._app_list_seq)
+    
+    def _scan_apps_worker(self, seq: int):
+        """Uygulama listesini UI thread'i dışında al ve sonucu Tk thread'ine gönder"""
         try:
-            # Mevcut seçili uygulamayı hatırla
-            selected_items = self.app_tree.selection()
-            selected_exe = None
-            if selected_items:
-                selected_exe = self.app_tree.item(selected_items[0])['tags'][0]
-
-            # Mevcut listeyi temizle
-            for item in self.app_tree.get_children():
-                self.app_tree.delete(item)
+            apps = list(self.system_service.get_available_applications())
+            self.root.after(0, self._apply_app_list, apps, seq)
+        except Exception as e:
+            self.log_message(f"Uygulama listesi güncellenirken hata oluştu: {str(e)}", "error")
+    
+    def _apply_app_list(self, apps, seq: int):
+        """Treeview'i verilen uygulama listesine göre güncelle; daha yeni bir liste uygulandıysa atla"""
+        if seq < self._app_list_applied_seq:
+            return
+        self._app_list_applied_seq = seq
+        try:
+            new_rows = {
+                app.exe_name: (app.name, "Çalışıyor" if app.is_running else "Durgun", app.description)
+                for app in apps
+            }
+            tree = self.app_tree
             
-            # Uygulamaları listele
-            for app in self.system_service.get_available_applications():
-                status = "Çalışıyor" if app.is_running else "Durgun"
-                self.app_tree.insert('', tk.END, values=(app.name, status, app.description), tags=(app.exe_name,))
-                
-            # Önceki seçimi geri yükle
-            if selected_exe:
-                for item in self.app_tree.get_children():
-                    if selected_exe in self.app_tree.item(item)['tags']:
-                        self.app_tree.selection_set(item)
-                        self.app_tree.see(item)
-                        break
+            # Kaldırılan uygulamaları tek çağrıda sil
+            removed = self._app_row_by_exe.keys() - new_rows.keys()
+            if removed:
+                tree.delete(*(self._app_row_by_exe.pop(exe)[0] for exe in removed))
+            
+            # Sadece değeri değişen satırları güncelle (item() sarmalayıcısı atlanır)
+            for exe, values in new_rows.items():
+                row = self._app_row_by_exe.get(exe)
+                if row and row[1] != values:
+                    tree.tk.call(tree._w, "item", row[0], "-values", values)
+                    self._app_row_by_exe[exe] = (row[0], values)
+            
+            # Yeni uygulamaları tek bir Tcl çağrısıyla ekle
+            added = [exe for exe in new_rows if exe not in self._app_row_by_exe]
+            if added:
+                rows = [field for exe in added for field in (new_rows[exe], exe)]
+                for exe, item_id in zip(added, self._insert_app_rows(rows)):
+                    self._app_row_by_exe[exe] = (item_id, new_rows[exe])
                         
         except Exception as e:
             self.log_message(f"Uygulama listesi güncellenirken hata oluştu: {str(e)}", "error")
     
-    def launch_selected_app(self):
-        """Seçili uygulamayı başlat"""
+    def _insert_app_rows(self, rows) -> tuple:
+        """Insert flattened (values, exe_name) pairs and return the new item ids"""
+        if not rows:
+            return ()
+        tree = self.app_tree
+        return tree.tk.splitlist(tree.tk.call("apply", _TREE_INSERT_ROWS, tree._w, tuple(rows)))
+    
+    def _get_selected_exe(self) -> Optional[str]:
+        """Seçili uygulamanın exe adını döndür; seçim yoksa uyar"""
         selection = self.app_tree.selection()
         if not selection:
             messagebox.showwarning("Uyarı", "Lütfen bir uygulama seçin")
-            return
-            
-        item = selection[0]
-        exe_name = self.app_tree.item(item)['tags'][0]
-        
-        if self.system_service.launch_application(exe_name):
-            self.log_message(f"{exe_name} uygulaması başlatıldı", "success")
-            self.refresh_app_list()
-        else:
-            self.log_message(f"{exe_name} uygulaması başlatılamadı", "error")
+            return None
+        return self.app_tree.item(selection[0])['tags'][0]
+    
+    def launch_selected_app(self):
+        """Seçili uygulamayı başlat"""
+        exe_name = self._get_selected_exe()
+        if exe_name:
+            threading.Thread(
+                target=self._app_action_worker,
+                args=(self.system_service.launch_application, exe_name, "başlatıldı", "başlatılamadı"),
+                daemon=True
+            ).start()
     
     def terminate_selected_app(self):
         """Seçili uygulamayı sonlandır"""
-        selection = self.app_tree.selection()
-        if not selection:
-            messagebox.showwarning("Uyarı", "Lütfen bir uygulama seçin")
-            return
-            
-        item = selection[0]
-        exe_name = self.app_tree.item(item)['tags'][0]
-        
-        if self.system_service.terminate_application(exe_name):
-            self.log_message(f"{exe_name} uygulaması kapatıldı", "success")
-            self.refresh_app_list()
-        else:
-            self.log_message(f"{exe_name} uygulaması kapatılamadı", "error")
+        exe_name = self._get_selected_exe()
+        if exe_name:
+            threading.Thread(
+                target=self._app_action_worker,
+                args=(self.system_service.terminate_application, exe_name, "kapatıldı", "kapatılamadı"),
+                daemon=True
+            ).start()
+    
+    def _app_action_worker(self, action: Callable[[str], bool], exe_name: str, done: str, failed: str):
+        """Başlatma/kapatma işlemini arka planda çalıştır, sonucu Tk thread'inde göster"""
+        try:
+            if action(exe_name):
+                self.log_message(f"{exe_name} uygulaması {done}", "success")
+                self.root.after(0, self.refresh_app_list)
+            else:
+                self.log_message(f"{exe_name} uygulaması {failed}", "error")
+        except Exception as e:
+            self.log_message(f"{exe_name} uygulaması {failed}: {str(e)}", "error")
     
     def toggle_listening(self):
         """Toggle listening state"""
@@ -388,25 +517,65 @@ class VoiceAssistantUI:
     
     def update_time(self):
         """Update the time display"""
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_label.configure(text=current_time)
-        self.root.after(1000, self.update_time)
+        now = time.time()
+        current_time = time.strftime("%H:%M:%S", time.localtime(now))
+        if current_time != self._last_time_str:
+            self.time_label.configure(text=current_time)
+            self._last_time_str = current_time
+        # Bir sonraki saniye sınırına zamanla; after() kayması birikmesin
+        self.root.after(1000 - int(now * 1000) % 1000, self.update_time)
     
     def log_message(self, message: str, level: str = "info"):
         """Add a message to the log display."""
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = self._timestamp()
             formatted_message = f"[{timestamp}] {message}\n"
             
-            self.console.insert(tk.END, formatted_message, level)
-            self.console.see(tk.END)
+            # Safe from any thread; the Tk thread writes it on the next flush
+            self._log_queue.put_nowait((formatted_message, level))
             
             # Also log to system logger
             log_level = getattr(logging, level.upper(), logging.INFO)
             logger.log(log_level, message)
             
         except Exception as e:
-            logger.error(f"Error logging message: {e}\n{traceback.format_exc()}")
+            logger.exception("Error logging message: %s", e)
+    
+    def _timestamp(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        second = int(time.time())
+        last_second, formatted = self._last_timestamp
+        if second != last_second:
+            formatted = time.strftime("%H:%M:%S", time.localtime(second))
+            self._last_timestamp = (second, formatted)
+        return formatted
+    
+    def _flush_logs(self):
+        """Write queued log messages to the console in a single insert"""
+        try:
+            segments = []
+            for _ in range(LOG_FLUSH_BATCH):
+                try:
+                    formatted_message, level = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                segments.extend((formatted_message, level))
+            
+            if segments:
+                # Only follow new output if the user has not scrolled up
+                at_bottom = self.console.yview()[1] >= 1.0
+                self.console.insert(tk.END, *segments)
+                
+                line_count = int(self.console.index('end-1c').split('.')[0])
+                if line_count > CONSOLE_MAX_LINES:
+                    self.console.delete('1.0', f'{line_count - CONSOLE_MAX_LINES}.0')
+                
+                if at_bottom:
+                    self.console.see(tk.END)
+        except Exception as e:
+            logger.exception("Error flushing log messages: %s", e)
+        finally:
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_logs)
     
     def clear_console(self):
         """Clear the console output"""
@@ -419,46 +588,94 @@ class VoiceAssistantUI:
             self.root.mainloop()
             logger.info("UI main loop ended")
         except Exception as e:
-            logger.critical(f"UI main loop error: {e}\n{traceback.format_exc()}")
+            logger.critical("UI main loop error: %s", e, exc_info=True)
             raise
     
     def stop(self):
         """Stop the UI"""
         self.root.quit()
     
+    def _ask_async(self, title: str, message: str, on_ok: Callable):
+        """İç içe event loop açmadan onay sor; Tamam seçilirse on_ok çağrılır"""
+        if self._confirm_dialog is not None:
+            self._confirm_dialog.lift()
+            return
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.configure(bg=COLOR_BG)
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        self._confirm_dialog = dialog
+        
+        def close():
+            self._confirm_dialog = None
+            dialog.destroy()
+        
+        def ok():
+            close()
+            on_ok()
+        
+        ttk.Label(dialog, text=message, justify=tk.LEFT).pack(padx=20, pady=(20, 10))
+        buttons = ttk.Frame(dialog)
+        buttons.pack(fill=tk.X, padx=20, pady=(0, 20))
+        ttk.Button(buttons, text="İptal", command=close).pack(side=tk.RIGHT)
+        ttk.Button(buttons, text="Tamam", command=ok).pack(side=tk.RIGHT, padx=(0, 5))
+        
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        dialog.bind("<Return>", lambda event: ok())
+        dialog.bind("<Escape>", lambda event: close())
+        dialog.grab_set()
+        dialog.focus_set()
+    
     def on_closing(self):
         """Handle application closing"""
-        if messagebox.askokcancel("Çıkış", "Sesli asistanı kapatmak istediğinize emin misiniz?"):
-            # Dinlemeyi durdur
-            if self.is_listening and self.on_stop:
-                self.on_stop()
-            
-            self.log_message("Lazzaran Sesli Asistan kapatılıyor...", "warning")
-            self.root.after(1000, self.root.destroy)  # 1 saniye bekleyip kapat
+        self._ask_async("Çıkış", "Sesli asistanı kapatmak istediğinize emin misiniz?", self._do_close)
+    
+    def _do_close(self):
+        """Onaydan sonra uygulamayı kapat"""
+        # Dinlemeyi durdur
+        if self.is_listening and self.on_stop:
+            self.on_stop()
+        
+        self.log_message("Lazzaran Sesli Asistan kapatılıyor...", "warning")
+        self.root.after(1000, self.root.destroy)  # 1 saniye bekleyip kapat
     
     def show_loading_screen(self):
-        """Profesyonel yükleme ekranını göster"""
+        """Profesyonel yükleme ekranını göster; pencere ilk seferde kurulur, sonra yeniden kullanılır"""
+        if self.loading_window is None:
+            self._build_loading_screen()
+        else:
+            self.progress_bar['value'] = 0
+            self.loading_canvas.itemconfig(self.progress_text, text="0%")
+            self.loading_canvas.itemconfig(self.status_text, text=self.loading_steps[0])
+            self.loading_window.deiconify()
+        
+        # Pencereyi ana pencerenin ortasına konumlandır
+        x = self.root.winfo_x() + (self.root.winfo_width() - LOADING_WINDOW_WIDTH) // 2
+        y = self.root.winfo_y() + (self.root.winfo_height() - LOADING_WINDOW_HEIGHT) // 2
+        self.loading_window.geometry(f"{LOADING_WINDOW_WIDTH}x{LOADING_WINDOW_HEIGHT}+{x}+{y}")
+        self.loading_window.grab_set()
+    
+    def _build_loading_screen(self):
+        """Yükleme ekranının pencere ve canvas öğelerini oluştur"""
+        window_width = LOADING_WINDOW_WIDTH
+        window_height = LOADING_WINDOW_HEIGHT
         self.loading_window = tk.Toplevel(self.root)
         self.loading_window.title("Yeniden Başlatılıyor")
         
-        # Pencere boyutu ve konumu
-        window_width = 400
-        window_height = 200
-        x = self.root.winfo_x() + (self.root.winfo_width() - window_width) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - window_height) // 2
-        self.loading_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
-        
         # Pencere özellikleri
         self.loading_window.transient(self.root)
-        self.loading_window.grab_set()
-        self.loading_window.configure(bg='#1e1e1e')
+        self.loading_window.configure(bg=COLOR_PANEL)
+        # Pencere yalnızca reset sırasında açık; reset bitene kadar kapatılamaz
+        self.loading_window.protocol("WM_DELETE_WINDOW", lambda: None)
         
         # Canvas oluştur
         self.loading_canvas = tk.Canvas(
             self.loading_window,
             width=window_width,
             height=window_height,
-            bg='#1e1e1e',
+            bg=COLOR_PANEL,
             highlightthickness=0
         )
         self.loading_canvas.pack(fill=tk.BOTH, expand=True)
@@ -469,28 +686,26 @@ class VoiceAssistantUI:
         x1 = (window_width - bar_width) // 2
         y1 = window_height // 2
         
-        # Arka plan çubuğu
-        self.loading_canvas.create_rectangle(
-            x1, y1,
-            x1 + bar_width, y1 + bar_height,
-            fill='#333333',
-            width=0
-        )
-        
         # İlerleme çubuğu
-        self.progress_bar = self.loading_canvas.create_rectangle(
+        self.progress_bar = ttk.Progressbar(
+            self.loading_canvas,
+            mode='determinate',
+            maximum=100,
+            length=bar_width,
+            style="Loading.Horizontal.TProgressbar"
+        )
+        self.loading_canvas.create_window(
             x1, y1,
-            x1, y1 + bar_height,
-            fill='#007acc',
-            width=0,
-            tags='progress'
+            window=self.progress_bar,
+            anchor=tk.NW,
+            height=bar_height
         )
         
         # Yüzde metni
         self.progress_text = self.loading_canvas.create_text(
             window_width // 2, y1 + 30,
             text="0%",
-            fill='#ffffff',
+            fill=COLOR_TEXT,
             font=('Segoe UI', 10),
             tags='progress_text'
         )
@@ -499,8 +714,8 @@ class VoiceAssistantUI:
         self.status_text = self.loading_canvas.create_text(
             window_width // 2, y1 - 30,
             text=self.loading_steps[0],
-            fill='#ffffff',
-            font=('Segoe UI', 11, 'bold'),
+            fill=COLOR_TEXT,
+            font=FONT_BOLD_LARGE,
             tags='status_text'
         )
         
@@ -508,7 +723,7 @@ class VoiceAssistantUI:
         self.loading_canvas.create_oval(
             window_width//2 - 40, 30,
             window_width//2 + 40, 110,
-            outline='#007acc',
+            outline=COLOR_ACCENT,
             width=2
         )
         
@@ -516,7 +731,7 @@ class VoiceAssistantUI:
         self.loading_canvas.create_text(
             window_width//2, 70,
             text="L",
-            fill='#007acc',
+            fill=COLOR_ACCENT,
             font=('Segoe UI', 36, 'bold')
         )
     
@@ -528,14 +743,7 @@ class VoiceAssistantUI:
             self.loading_progress = progress
             
             # İlerleme çubuğunu güncelle
-            bar_width = 300
-            x1 = (400 - bar_width) // 2
-            y1 = 200 // 2
-            self.loading_canvas.coords(
-                self.progress_bar,
-                x1, y1,
-                x1 + (bar_width * progress / 100), y1 + 6
-            )
+            self.progress_bar['value'] = progress
             
             # Metinleri güncelle
             self.loading_canvas.itemconfig(
@@ -548,78 +756,87 @@ class VoiceAssistantUI:
                     self.status_text,
                     text=self.loading_steps[step]
                 )
-            
-            # Ekranı güncelle
-            self.loading_window.update()
     
     def close_loading_screen(self):
         """Yükleme ekranını kapat"""
         if self.loading_window:
-            self.loading_window.destroy()
-            self.loading_window = None
-            self.loading_canvas = None
+            self.loading_window.grab_release()
+            self.loading_window.withdraw()
     
     def reset_assistant(self):
         """Asistanı resetle"""
-        if messagebox.askokcancel("Reset", 
+        if self._reset_running:
+            return
+        self._ask_async("Reset",
             "Sesli asistanı resetlemek istediğinize emin misiniz?\n\n"
             "Bu işlem:\n"
             "• Dinlemeyi durduracak\n"
             "• Konsolu temizleyecek\n"
             "• Uygulamaları yenileyecek\n"
-            "• Sistemi yeniden başlatacak"):
-            
-            # Yükleme ekranını göster
-            self.show_loading_screen()
-            
-            def reset_thread():
-                try:
-                    # Adım 1: Dinlemeyi durdur
-                    if self.is_listening:
-                        self.root.after(0, self.toggle_listening)
-                    self.root.after(0, lambda: self.update_loading_progress(0))
-                    self.root.after(500)
-                    
-                    # Adım 2: Konsolu temizle
-                    self.root.after(0, self.clear_console)
-                    self.root.after(0, lambda: self.update_loading_progress(1))
-                    self.root.after(500)
-                    
-                    # Adım 3: Uygulamaları yenile
-                    self.root.after(0, self.system_service.refresh_application_list)
-                    self.root.after(0, lambda: self.update_loading_progress(2))
-                    self.root.after(500)
-                    
-                    # Adım 4: Listeyi güncelle
-                    self.root.after(0, self.refresh_app_list)
-                    self.root.after(0, lambda: self.update_loading_progress(3))
-                    self.root.after(500)
-                    
-                    # Adım 5: Tamamlandı
-                    self.root.after(0, lambda: self.status_label.configure(text="Ready"))
-                    self.root.after(0, lambda: self.update_loading_progress(4))
-                    self.root.after(1000)
-                    
-                    # Yükleme ekranını kapat
-                    self.root.after(0, self.close_loading_screen)
-                    
-                    # Başarı mesajı
-                    self.root.after(0, lambda: self.log_message(
-                        "✓ Sesli asistan başarıyla resetlendi",
-                        "success"
-                    ))
-                    
-                except Exception as e:
-                    # Hata durumunda
-                    self.root.after(0, self.close_loading_screen)
-                    self.root.after(0, lambda: self.log_message(
-                        f"Reset sırasında hata oluştu: {str(e)}",
-                        "error"
-                    ))
-            
-            # Thread'i başlat
-            threading.Thread(target=reset_thread).start() 
+            "• Sistemi yeniden başlatacak",
+            self._do_reset)
+    
+    def _do_reset(self):
+        """Onaydan sonra asistanı resetle"""
+        if self._reset_running:
+            return
+        self._reset_running = True
+        
+        # Yükleme ekranını göster
+        self.show_loading_screen()
+        
+        def reset_thread():
+            # Ağır işler bu thread'de çalışır; widget güncellemeleri root.after ile Tk thread'ine gider
+            try:
+                # Adım 1: Dinlemeyi durdur
+                if self.is_listening:
+                    self.root.after(0, self.toggle_listening)
+                self.root.after(0, lambda: self.update_loading_progress(0))
+                time.sleep(0.5)
+                
+                # Adım 2: Konsolu temizle
+                self.root.after(0, self.clear_console)
+                self.root.after(0, lambda: self.update_loading_progress(1))
+                time.sleep(0.5)
+                
+                # Adım 3: Uygulamaları yenile
+                self.system_service.refresh_application_list()
+                apps = self.system_service.get_available_applications()
+                self.root.after(0, lambda: self.update_loading_progress(2))
+                time.sleep(0.5)
+                
+                # Adım 4: Listeyi güncelle
+                self.root.after(0, self.refresh_app_list, apps)
+                self.root.after(0, lambda: self.update_loading_progress(3))
+                time.sleep(0.5)
+                
+                # Adım 5: Tamamlandı
+                self.root.after(0, lambda: self.status_label.configure(text="Ready"))
+                self.root.after(0, lambda: self.update_loading_progress(4))
+                time.sleep(1.0)
+                
+                # Yükleme ekranını kapat
+                self.root.after(0, self._finish_reset)
+                
+                # Başarı mesajı
+                self.root.after(0, lambda: self.log_message(
+                    "✓ Sesli asistan başarıyla resetlendi",
+                    "success"
+                ))
+                
+            except Exception as e:
+                # Hata durumunda
+                error_msg = f"Reset sırasında hata oluştu: {str(e)}"
+                self.root.after(0, self._finish_reset)
+                self.root.after(0, lambda: self.log_message(error_msg, "error"))
+        
+        threading.Thread(target=reset_thread, name="reset", daemon=True).start() 
     
+    def _finish_reset(self):
+        """Reset bittiğinde yükleme ekranını kapat ve yeni resetlere izin ver"""
+        self.close_loading_screen()
+        self._reset_running = False
+
     def stop_speaking(self):
         """Stop current speech output"""
         try:
@@ -627,5 +844,5 @@ class VoiceAssistantUI:
             self.system_service.stop_speaking()
             self.log_message("Konuşma durduruldu", "info")
         except Exception as e:
-            logger.error(f"Error stopping speech: {e}\n{traceback.format_exc()}")
+            logger.exception("Error stopping speech: %s", e)
             self.log_message("Konuşma durdurulamadı", "error") 
\ No newline at end of file